@@ -327,7 +327,11 @@ class TournamentManager:
                         else:
                             return str(obj)
                     
-                    # Create simplified game data that avoids complex nested objects
+                    action_log = getattr(game, 'action_log', [])
+                    
+                    # Create simplified game data that avoids complex nested objects.
+                    # action_count comes before the (last) actions so readers can get it
+                    # without parsing them
                     game_data = {
                         "game_id": game_id,
                         "players": [{"name": p["name"], "color": p["color"] if isinstance(p["color"], str) else p["color"].value, "final_vp": final_scores.get(p["color"] if isinstance(p["color"], str) else p["color"].value, 0)} for p in player_info],
@@ -335,11 +339,11 @@ class TournamentManager:
                         "is_tie": is_tie,
                         "duration": game_duration,
                         "total_turns": getattr(game.state, 'num_turns', 0) if hasattr(game, 'state') else 0,
-                        "final_scores": final_scores
+                        "final_scores": final_scores,
+                        "action_count": len(action_log)
                     }
                     
                     # Only add action log if it exists and is small enough
-                    action_log = getattr(game, 'action_log', [])
                     if action_log and len(action_log) < 1000:  # Limit action log size
                         game_data["actions"] = action_log
                     
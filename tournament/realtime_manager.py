@@ -7,13 +7,15 @@ capabilities, web interface integration, and live game state broadcasting.
 
 import asyncio
 import copy
-import json
+import gzip
+import hashlib
 import time
 import logging
 import threading
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 from pathlib import Path
+import orjson
 import websockets
 import socketio
 from aiohttp import web, WSMsgType
@@ -26,6 +28,87 @@ from core.llm_player import LLMPlayer
 from core.game_state import GameStateExtractor
 
 
+# orjson handles the tuple coordinates and int-keyed node maps of Catanatron
+# states natively, so snapshots never need a Python-level key/value rebuild
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json(obj: Any, status: int = 200) -> web.Response:
+    """Build a JSON response from a single orjson-encoded body."""
+    return web.Response(body=orjson.dumps(obj, option=_ORJSON_OPTIONS), status=status, content_type='application/json')
+
+
+# Static dashboard assets, served with HTTP caching
+_STATIC_DIR = Path(__file__).parent / 'static'
+_DASHBOARD_PATH = _STATIC_DIR / 'dashboard.html'
+_DASHBOARD_CACHE_CONTROL = 'public, max-age=3600'
+
+# The dashboard page is read and gzipped once at import, so serving it costs no
+# file I/O or compression per request
+_DASHBOARD_HTML = _DASHBOARD_PATH.read_bytes()
+_DASHBOARD_HTML_GZIP = gzip.compress(_DASHBOARD_HTML)
+_DASHBOARD_ETAG = f'W/"{hashlib.sha1(_DASHBOARD_HTML).hexdigest()[:16]}"'
+
+
+# Every Nth game_state_update carries the full state so clients can resync
+_FULL_STATE_INTERVAL = 50
+
+# Pending game_state_update payloads are flushed to each client at most 30 times a second
+_STATE_FLUSH_INTERVAL = 1 / 30
+
+# A client that hasn't acked its last game_state_update within this many seconds
+# is written to again anyway (e.g. an old page without the ack handler)
+_STATE_ACK_TIMEOUT = 5.0
+
+# Recent states kept per game so a lagging client can still be sent a patch
+_STATE_HISTORY_SIZE = 8
+
+# Game statuses after which a game's state no longer changes
+_FINISHED_STATUSES = ('completed', 'tie', 'failed')
+
+
+def _make_patch(old: Dict[str, Any], new: Dict[str, Any], path: str = '') -> List[Dict[str, Any]]:
+    """
+    Compute a JSON Patch (RFC 6902) that turns ``old`` into ``new``.
+    
+    Nested dicts are diffed key by key; any other changed value is replaced whole.
+    """
+    def pointer(key):
+        return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+    
+    ops = []
+    for key, value in new.items():
+        key_path = pointer(key)
+        if key not in old:
+            ops.append({'op': 'add', 'path': key_path, 'value': value})
+            continue
+        
+        old_value = old[key]
+        if old_value == value:
+            continue
+        if isinstance(old_value, dict) and isinstance(value, dict):
+            ops.extend(_make_patch(old_value, value, key_path))
+        else:
+            ops.append({'op': 'replace', 'path': key_path, 'value': value})
+    
+    for key in old:
+        if key not in new:
+            ops.append({'op': 'remove', 'path': pointer(key)})
+    return ops
+
+
+class _OrjsonModule:
+    """Minimal ``json``-compatible shim so Socket.IO packets are encoded by orjson."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
 class RealTimeTournamentManager(TournamentManager):
     """
     Real-time tournament manager with web interface and live streaming capabilities.
@@ -43,7 +126,8 @@ class RealTimeTournamentManager(TournamentManager):
         output_dir: str = "tournament_results",
         log_level: str = "INFO",
         web_port: int = 8080,
-        enable_websockets: bool = True
+        enable_websockets: bool = True,
+        catanatron_ui_url: str = "http://localhost:3002"
     ):
         """
         Initialize real-time tournament manager.
@@ -54,12 +138,14 @@ class RealTimeTournamentManager(TournamentManager):
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
             web_port: Port for the web interface
             enable_websockets: Whether to enable WebSocket broadcasting
+            catanatron_ui_url: URL of the Catanatron visual UI linked from the dashboard
         """
         super().__init__(name, output_dir, log_level)
         
         # Web interface configuration
         self.web_port = web_port
         self.enable_websockets = enable_websockets
+        self.catanatron_ui_url = catanatron_ui_url
         
         # Real-time state tracking
         self.current_games = {}  # game_id -> game_state
@@ -68,7 +154,7 @@ class RealTimeTournamentManager(TournamentManager):
         self.tournament_status = "not_started"
         
         # WebSocket and web server
-        self.sio = socketio.AsyncServer(cors_allowed_origins="*")
+        self.sio = socketio.AsyncServer(cors_allowed_origins="*", json=_OrjsonModule)
         self.app = web.Application()
         
         # Game state extractor for real-time updates
@@ -77,6 +163,23 @@ class RealTimeTournamentManager(TournamentManager):
         # Store reference to web server's event loop for cross-thread communication
         self.web_loop = None
         
+        # Last leaderboard pushed to clients, to only broadcast actual changes
+        self._last_leaderboard = None
+        
+        # Recent Catanatron states and the latest sequence number per game,
+        # used to send game_state_update as a patch against what a client already has
+        self._state_history = {}  # game_id -> {seq: state dict}
+        self._state_seqs = {}     # game_id -> int
+        # Games that ended: only their final state is kept, and new clients aren't sent it
+        self._finished_games = set()
+        
+        # Per-client game_state_update backpressure: only the latest state of each
+        # changed game is sent, and never while the client's last write is unacked
+        self._pending_states = {}  # sid -> set of game_ids changed since last flush
+        self._client_seqs = {}     # sid -> {game_id: seq last sent}
+        self._unacked = {}         # sid -> monotonic time of the unacked write
+        self._state_flusher = None
+        
         # Setup web routes first, then attach Socket.IO
         self._setup_web_routes()
         self._setup_socket_events()
@@ -105,10 +208,14 @@ class RealTimeTournamentManager(TournamentManager):
         # Serve static files
         self.app.router.add_get('/', self._serve_index)
         self.app.router.add_get('/tournament', self._serve_tournament_page)
+        self.app.router.add_get('/api/tournament/config', self._get_tournament_config)
         self.app.router.add_get('/api/tournament/status', self._get_tournament_status)
         self.app.router.add_get('/api/tournament/games', self._get_current_games)
         self.app.router.add_get('/api/tournament/leaderboard', self._get_leaderboard_api)
         
+        # Dashboard assets (the connection worker)
+        self.app.router.add_static('/static', _STATIC_DIR)
+        
         # Catanatron UI compatibility endpoints
         self.app.router.add_post('/api/games', self._create_or_list_games)
         self.app.router.add_get('/api/games', self._list_games)
@@ -131,6 +238,9 @@ class RealTimeTournamentManager(TournamentManager):
             return response
         
         self.app.middlewares.append(cors_middleware)
+        
+        self.app.on_startup.append(self._start_state_flusher)
+        self.app.on_cleanup.append(self._stop_state_flusher)
     
     def _setup_socket_events(self):
         """Setup Socket.IO event handlers."""
@@ -139,6 +249,10 @@ class RealTimeTournamentManager(TournamentManager):
         async def connect(sid, environ):
             """Handle client connection."""
             self.connected_clients.add(sid)
+            # Queue every running game so the first flush sends this client the full
+            # states; a finished game's final state is sent on sync_game_state
+            self._pending_states[sid] = set(self._state_seqs) - self._finished_games
+            self._client_seqs[sid] = {}
             # self.logger.info(f"Client connected: {sid} (total: {len(self.connected_clients)})")
             
             # Send current tournament status
@@ -147,11 +261,18 @@ class RealTimeTournamentManager(TournamentManager):
                 'tournament_info': getattr(self, 'tournament_info', {}),
                 'current_games': list(self.current_games.keys())
             }, room=sid)
+            
+            # Send the games and leaderboard snapshots so the client never needs to poll
+            await self.sio.emit('games_snapshot', self._serializable_games(), room=sid)
+            await self.sio.emit('leaderboard_snapshot', self.get_leaderboard(), room=sid)
         
         @self.sio.event
         async def disconnect(sid):
             """Handle client disconnection."""
             self.connected_clients.discard(sid)
+            self._pending_states.pop(sid, None)
+            self._client_seqs.pop(sid, None)
+            self._unacked.pop(sid, None)
             # self.logger.info(f"Client disconnected: {sid} (total: {len(self.connected_clients)})")
         
         @self.sio.event
@@ -165,6 +286,15 @@ class RealTimeTournamentManager(TournamentManager):
                 await self.sio.emit('game_state', game_data, room=sid)
                 self.logger.debug(f"Client {sid} joined game {game_id}")
         
+        @self.sio.event
+        async def sync_game_state(sid, data):
+            """Send a full game state to a client that missed a patch."""
+            game_id = data.get('game_id')
+            if game_id in self._state_seqs and sid in self._pending_states:
+                # Forget what the client has so the next flush sends the full state
+                self._client_seqs[sid].pop(game_id, None)
+                self._pending_states[sid].add(game_id)
+        
         @self.sio.event
         async def leave_game(sid, data):
             """Handle client leaving a game view."""
@@ -175,16 +305,33 @@ class RealTimeTournamentManager(TournamentManager):
     
     async def _serve_index(self, request):
         """Serve the main tournament page."""
-        html_content = self._generate_tournament_html()
-        return web.Response(text=html_content, content_type='text/html')
+        headers = {
+            'Cache-Control': _DASHBOARD_CACHE_CONTROL,
+            'ETag': _DASHBOARD_ETAG,
+            'Vary': 'Accept-Encoding'
+        }
+        if request.headers.get('If-None-Match') == _DASHBOARD_ETAG:
+            return web.Response(status=304, headers=headers)
+        
+        body = _DASHBOARD_HTML
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            body = _DASHBOARD_HTML_GZIP
+            headers['Content-Encoding'] = 'gzip'
+        return web.Response(body=body, content_type='text/html', charset='utf-8', headers=headers)
     
     async def _serve_tournament_page(self, request):
         """Serve the tournament viewing page."""
         return await self._serve_index(request)
     
+    async def _get_tournament_config(self, request):
+        """API endpoint for the dashboard's configuration."""
+        return _json({
+            'catanatron_ui_url': self.catanatron_ui_url
+        })
+    
     async def _get_tournament_status(self, request):
         """API endpoint for tournament status."""
-        return web.json_response({
+        return _json({
             'status': self.tournament_status,
             'tournament_info': getattr(self, 'tournament_info', {}),
             'current_games': list(self.current_games.keys()),
@@ -193,27 +340,35 @@ class RealTimeTournamentManager(TournamentManager):
     
     async def _get_current_games(self, request):
         """API endpoint for current games."""
-        # Create serializable version of current games (exclude catanatron_state)
+        return _json(self._serializable_games())
+    
+    def _serializable_games(self) -> Dict[str, Dict[str, Any]]:
+        """Create serializable version of current games (exclude catanatron_state)."""
         serializable_games = {}
         for game_id, game_data in self.current_games.items():
             serializable_data = {k: v for k, v in game_data.items() if k != 'catanatron_state'}
             serializable_games[game_id] = serializable_data
-        return web.json_response(serializable_games)
+        return serializable_games
     
     async def _get_leaderboard_api(self, request):
         """API endpoint for tournament leaderboard."""
         try:
             leaderboard = self.get_leaderboard()
-            return web.json_response(leaderboard)
+            return _json(leaderboard)
         except Exception as e:
-            return web.json_response({'error': str(e)}, status=500)
+            return _json({'error': str(e)}, status=500)
     
     async def _get_game_state(self, request):
         """Catanatron UI compatibility - get latest game state."""
         game_id = request.match_info['game_id']
         if game_id not in self.current_games:
-            return web.json_response({'error': 'Game not found'}, status=404)
+            return _json({'error': 'Game not found'}, status=404)
         
+        catanatron_state = self._build_game_state(game_id)
+        return _json(catanatron_state)
+    
+    def _build_game_state(self, game_id: str) -> Dict[str, Any]:
+        """Build the Catanatron-compatible state snapshot for a tracked game."""
         game_data = self.current_games[game_id]
         
         # Create a minimal Catanatron-compatible game state
@@ -235,7 +390,7 @@ class RealTimeTournamentManager(TournamentManager):
                 if hasattr(catanatron_game_state.board, 'map') and hasattr(catanatron_game_state.board.map, 'tiles'):
                     for coordinate, tile in catanatron_game_state.board.map.tiles.items():
                         tile_data = {
-                            "coordinate": list(coordinate) if isinstance(coordinate, tuple) else coordinate,
+                            "coordinate": coordinate,
                             "tile": {
                                 "id": tile_id,
                                 "type": "DESERT" if not hasattr(tile, 'resource') or tile.resource is None else "RESOURCE_TILE"
@@ -617,7 +772,7 @@ class RealTimeTournamentManager(TournamentManager):
         # if building_nodes:
         #     self.logger.info(f"  Sample building node: {building_nodes[0]}")
         
-        return web.json_response(catanatron_state)
+        return catanatron_state
     
     async def _get_game_state_at_index(self, request):
         """Catanatron UI compatibility - get game state at specific index."""
@@ -625,7 +780,7 @@ class RealTimeTournamentManager(TournamentManager):
         state_index = request.match_info['state_index']
         
         if game_id not in self.current_games:
-            return web.json_response({'error': 'Game not found'}, status=404)
+            return _json({'error': 'Game not found'}, status=404)
             
         # Log the request for debugging
         self.logger.debug(f"Game state requested for {game_id} at index {state_index}")
@@ -642,12 +797,12 @@ class RealTimeTournamentManager(TournamentManager):
         # Instead of creating a new game, return the first available tournament game
         if self.current_games:
             first_game_id = list(self.current_games.keys())[0]
-            return web.json_response({
+            return _json({
                 'game_id': first_game_id,
                 'message': 'Connected to tournament game'
             })
         else:
-            return web.json_response({
+            return _json({
                 'error': 'No active tournament games',
                 'message': 'Start a tournament to see games here'
             }, status=404)
@@ -665,7 +820,7 @@ class RealTimeTournamentManager(TournamentManager):
                 'players': game_data.get('players', []),
                 'created_at': game_data.get('start_time')
             })
-        return web.json_response(games_list)
+        return _json(games_list)
     
     async def _post_game_action(self, request):
         """Catanatron UI compatibility - handle game actions (read-only for tournaments)."""
@@ -684,7 +839,7 @@ class RealTimeTournamentManager(TournamentManager):
             mock_request = type('MockRequest', (), {'match_info': {'game_id': game_id}})()
             return await self._get_game_state(mock_request)
         else:
-            return web.json_response({
+            return _json({
                 'error': 'Game not found',
                 'message': 'Tournament game not available'
             }, status=404)
@@ -702,7 +857,8 @@ class RealTimeTournamentManager(TournamentManager):
                     host='0.0.0.0', 
                     port=self.web_port,
                     # access_log=self.logger,
-                    handle_signals=False  # Fix: prevent signal handler errors in threads
+                    handle_signals=False,  # Fix: prevent signal handler errors in threads
+                    loop=self.web_loop  # Run on the loop broadcasts are scheduled onto
                 )
             except Exception as e:
                 self.logger.error(f"Web server error: {e}")
@@ -802,6 +958,7 @@ class RealTimeTournamentManager(TournamentManager):
         # Broadcast the new game immediately so UI can display it
         self.logger.info(f"Creating game {game_id} with players: {player_names}")
         self._safe_create_task(self._broadcast_game_update(game_id))
+        self._safe_create_task(self._broadcast_games_snapshot())
         
         # Create a custom Game class that broadcasts updates
         result = self._play_game_with_streaming(
@@ -818,6 +975,8 @@ class RealTimeTournamentManager(TournamentManager):
         
         # Broadcast final update safely
         self._safe_create_task(self._broadcast_game_update(game_id))
+        self._safe_create_task(self._broadcast_games_snapshot())
+        self._safe_create_task(self._broadcast_leaderboard_snapshot())
         
         return result
     
@@ -1038,7 +1197,8 @@ class RealTimeTournamentManager(TournamentManager):
             return
         
         try:
-            game_data = self.current_games[game_id]
+            # Send serializable game data (exclude catanatron_state)
+            game_data = {k: v for k, v in self.current_games[game_id].items() if k != 'catanatron_state'}
             
             # Broadcast to all clients for dashboard
             await self.sio.emit('game_update', {
@@ -1048,25 +1208,13 @@ class RealTimeTournamentManager(TournamentManager):
             
             # Get the full Catanatron-compatible game state for UI updates
             try:
-                # Create a mock request to get game state
-                mock_request = type('MockRequest', (), {
-                    'match_info': {'game_id': game_id}
-                })()
+                full_game_state = self._build_game_state(game_id)
                 
-                # Get the full game state that would be sent to Catanatron UI
-                response = await self._get_game_state(mock_request)
-                if hasattr(response, 'text'):
-                    import json
-                    full_game_state = json.loads(await response.text())
-                    
-                    # Broadcast full game state to trigger UI refresh
-                    await self.sio.emit('game_state_update', {
-                        'game_id': game_id,
-                        'state': full_game_state
-                    })
-                    
-                    # Also broadcast to game-specific room
-                    await self.sio.emit('game_state', full_game_state, room=f"game_{game_id}")
+                # Queue the state change for each client; the flusher sends it to trigger UI refresh
+                self._queue_state_update(game_id, full_game_state)
+                
+                # Also broadcast to game-specific room
+                await self.sio.emit('game_state', full_game_state, room=f"game_{game_id}")
                     
             except Exception as state_error:
                 self.logger.warning(f"Could not broadcast full game state: {state_error}")
@@ -1076,6 +1224,119 @@ class RealTimeTournamentManager(TournamentManager):
         except Exception as e:
             self.logger.error(f"Error broadcasting game update: {e}")
     
+    def _queue_state_update(self, game_id: str, state: Dict[str, Any]):
+        """Record a new state for a game and mark it pending for every connected client."""
+        seq = self._state_seqs.get(game_id, 0) + 1
+        self._state_seqs[game_id] = seq
+        if self.current_games.get(game_id, {}).get('status') in _FINISHED_STATUSES:
+            # No more patches follow, so the history is dropped for the final state
+            self._finished_games.add(game_id)
+            self._state_history[game_id] = {seq: state}
+        else:
+            history = self._state_history.setdefault(game_id, {})
+            history[seq] = state
+            history.pop(seq - _STATE_HISTORY_SIZE, None)
+        
+        # A pending set holds each game once, so a slow client only ever gets the latest state
+        for pending in self._pending_states.values():
+            pending.add(game_id)
+    
+    def _encode_state_update(self, game_id: str, base_seq: Optional[int],
+                             patches: Dict[tuple, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Build a game_state_update payload: a JSON Patch against the client's last state, or the full state."""
+        seq = self._state_seqs[game_id]
+        history = self._state_history[game_id]
+        
+        if base_seq not in history or seq % _FULL_STATE_INTERVAL == 0:
+            return {'game_id': game_id, 'seq': seq, 'state': history[seq]}
+        
+        # Clients at the same seq share one patch per flush
+        key = (game_id, base_seq)
+        if key not in patches:
+            patches[key] = _make_patch(history[base_seq], history[seq])
+        return {
+            'game_id': game_id,
+            'seq': seq,
+            'base_seq': base_seq,
+            'patch': patches[key]
+        }
+    
+    async def _flush_state_updates(self):
+        """Send each client the latest state of the games that changed since its last flush."""
+        while True:
+            await asyncio.sleep(_STATE_FLUSH_INTERVAL)
+            try:
+                await self._flush_pending_states()
+            except Exception as e:
+                self.logger.error(f"Error flushing game state updates: {e}")
+    
+    async def _flush_pending_states(self):
+        """Run one flush pass, skipping clients that haven't acked their previous write."""
+        now = time.monotonic()
+        patches = {}
+        
+        for sid, pending in list(self._pending_states.items()):
+            if not pending:
+                continue
+            sent_at = self._unacked.get(sid)
+            if sent_at is not None and now - sent_at < _STATE_ACK_TIMEOUT:
+                continue  # Slow consumer: keep coalescing until it catches up
+            
+            client_seqs = self._client_seqs[sid]
+            game_ids = list(pending)
+            pending.clear()
+            self._unacked[sid] = now
+            
+            for game_id in game_ids:
+                payload = self._encode_state_update(game_id, client_seqs.get(game_id), patches)
+                if game_id in self._finished_games:
+                    # The final state is never patched, so there is nothing to track
+                    client_seqs.pop(game_id, None)
+                else:
+                    client_seqs[game_id] = payload['seq']
+                await self.sio.emit(
+                    'game_state_update', payload, room=sid,
+                    callback=lambda *args, sid=sid, sent_at=now: self._ack_state_update(sid, sent_at)
+                )
+    
+    def _ack_state_update(self, sid: str, sent_at: float):
+        """Mark a client ready for its next flush once it acks a game_state_update."""
+        if self._unacked.get(sid) == sent_at:
+            del self._unacked[sid]
+    
+    async def _start_state_flusher(self, app):
+        """Start the game_state_update flusher on the web server's event loop."""
+        self._state_flusher = asyncio.create_task(self._flush_state_updates())
+    
+    async def _stop_state_flusher(self, app):
+        """Stop the game_state_update flusher when the web server shuts down."""
+        if self._state_flusher is not None:
+            self._state_flusher.cancel()
+    
+    async def _broadcast_games_snapshot(self):
+        """Push the full games list after games are added or finish."""
+        if not self.enable_websockets:
+            return
+        
+        try:
+            await self.sio.emit('games_snapshot', self._serializable_games())
+        except Exception as e:
+            self.logger.error(f"Error broadcasting games snapshot: {e}")
+    
+    async def _broadcast_leaderboard_snapshot(self):
+        """Push the leaderboard when the standings have changed."""
+        if not self.enable_websockets:
+            return
+        
+        try:
+            leaderboard = self.get_leaderboard()
+            if leaderboard == self._last_leaderboard:
+                return
+            self._last_leaderboard = leaderboard
+            await self.sio.emit('leaderboard_snapshot', leaderboard)
+        except Exception as e:
+            self.logger.error(f"Error broadcasting leaderboard snapshot: {e}")
+    
     async def _broadcast_tournament_status(self):
         """Broadcast tournament status update."""
         if not self.enable_websockets:
@@ -1092,488 +1353,3 @@ class RealTimeTournamentManager(TournamentManager):
             self.logger.info(f"Broadcast tournament status: {self.tournament_status} to {len(self.connected_clients)} clients")
         except Exception as e:
             self.logger.error(f"Error broadcasting tournament status: {e}")
-    
-    def _generate_tournament_html(self) -> str:
-        """Generate the main tournament viewing HTML page."""
-        return '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>CatanBench Real-time Tournament</title>
-    <script src="https://cdn.socket.io/4.7.4/socket.io.min.js" 
-            integrity="sha384-Gr6Lu2Ajx28mzwyVR8CFkULdCU7kMlZ9UthllibdOSo6qAiN+yXNHqtgdTvFXMT4" 
-            crossorigin="anonymous"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: #333;
-            min-height: 100vh;
-        }
-        
-        .header {
-            background: rgba(255, 255, 255, 0.95);
-            padding: 1rem;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-        }
-        
-        .header h1 {
-            text-align: center;
-            color: #2c3e50;
-            margin-bottom: 0.5rem;
-        }
-        
-        .status-bar {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .status-badge {
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-weight: bold;
-            text-transform: uppercase;
-            font-size: 0.8rem;
-        }
-        
-        .status-not_started { background: #ffeaa7; color: #2d3436; }
-        .status-running { background: #55a3ff; color: white; }
-        .status-completed { background: #00b894; color: white; }
-        .status-failed { background: #e17055; color: white; }
-        
-        .main-content {
-            max-width: 1200px;
-            margin: 2rem auto;
-            padding: 0 1rem;
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 2rem;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        .card h2 {
-            margin-bottom: 1rem;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 0.5rem;
-        }
-        
-        .games-grid {
-            display: grid;
-            gap: 1rem;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        }
-        
-        .game-card {
-            background: linear-gradient(135deg, #74b9ff, #0984e3);
-            color: white;
-            padding: 1rem;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: transform 0.3s ease;
-        }
-        
-        .game-card:hover {
-            transform: translateY(-2px);
-        }
-        
-        .game-id {
-            font-weight: bold;
-            font-size: 1.1rem;
-            margin-bottom: 0.5rem;
-        }
-        
-        .game-players {
-            font-size: 0.9rem;
-            opacity: 0.9;
-            margin-bottom: 0.5rem;
-        }
-        
-        .game-status {
-            display: inline-block;
-            padding: 0.2rem 0.5rem;
-            border-radius: 12px;
-            background: rgba(255,255,255,0.2);
-            font-size: 0.8rem;
-        }
-        
-        .leaderboard-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        
-        .leaderboard-table th,
-        .leaderboard-table td {
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        
-        .leaderboard-table th {
-            background: #f8f9fa;
-            font-weight: bold;
-            color: #2c3e50;
-        }
-        
-        .leaderboard-table tr:nth-child(even) {
-            background: #f8f9fa;
-        }
-        
-        .catanatron-link {
-            display: block;
-            margin-top: 1rem;
-            padding: 0.75rem;
-            background: #00b894;
-            color: white;
-            text-decoration: none;
-            border-radius: 6px;
-            text-align: center;
-            font-weight: bold;
-        }
-        
-        .catanatron-link:hover {
-            background: #00a085;
-        }
-        
-        .catanatron-info {
-            margin-top: 1rem;
-            padding: 1rem;
-            background: #f8f9fa;
-            border-radius: 6px;
-            border-left: 4px solid #3498db;
-        }
-        
-        .catanatron-info h3 {
-            margin-bottom: 0.5rem;
-            color: #2c3e50;
-        }
-        
-        .catanatron-info ol {
-            margin: 0.5rem 0;
-            padding-left: 1.5rem;
-        }
-        
-        .catanatron-info code {
-            background: #e9ecef;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Monaco', 'Menlo', monospace;
-            font-size: 0.85em;
-        }
-        
-        .connection-status {
-            font-size: 0.9rem;
-        }
-        
-        .connected { color: #00b894; }
-        .disconnected { color: #e17055; }
-        
-        @media (max-width: 768px) {
-            .main-content {
-                grid-template-columns: 1fr;
-                gap: 1rem;
-            }
-            
-            .status-bar {
-                flex-direction: column;
-                gap: 0.5rem;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🏰 CatanBench Real-time Tournament</h1>
-        <div class="status-bar">
-            <div>
-                <span class="status-badge" id="tournament-status">Not Started</span>
-            </div>
-            <div class="connection-status">
-                <span id="connection-status" class="disconnected">Disconnected</span>
-                | <span id="client-count">0</span> viewers
-            </div>
-        </div>
-    </div>
-    
-    <div class="main-content">
-        <div class="card">
-            <h2>🎮 Current Games</h2>
-            <div id="games-container" class="games-grid">
-                <div style="text-align: center; color: #666; padding: 2rem;">
-                    No games running
-                </div>
-            </div>
-            
-            <div class="catanatron-info">
-                <h3>🎮 Visual Game Interface</h3>
-                <p>To view games with full visual interface:</p>
-                <ol>
-                    <li><strong>Docker (Recommended):</strong><br>
-                        Run <code>docker compose up</code> in project directory<br>
-                        Then visit <a href="http://localhost:3002" target="_blank">localhost:3002</a>
-                    </li>
-                    <li><strong>Manual Setup:</strong><br>
-                        Install Node.js 24+, then:<br>
-                        <code>cd catanatron/ui && npm install && npm run start</code>
-                    </li>
-                </ol>
-                <a href="#" onclick="checkCatanatronStatus()" class="catanatron-link">
-                    🔍 Check Visual GUI Status
-                </a>
-            </div>
-        </div>
-        
-        <div class="card">
-            <h2>🏆 Leaderboard</h2>
-            <div id="leaderboard-container">
-                <table class="leaderboard-table">
-                    <thead>
-                        <tr>
-                            <th>Rank</th>
-                            <th>Player</th>
-                            <th>Wins</th>
-                            <th>Games</th>
-                            <th>Win Rate</th>
-                        </tr>
-                    </thead>
-                    <tbody id="leaderboard-body">
-                        <tr>
-                            <td colspan="5" style="text-align: center; color: #666;">
-                                No data available
-                            </td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Initialize Socket.IO connection
-        console.log('Socket.IO library loaded:', typeof io);
-        const socket = io();
-        
-        // DOM elements
-        const tournamentStatus = document.getElementById('tournament-status');
-        const connectionStatus = document.getElementById('connection-status');
-        const clientCount = document.getElementById('client-count');
-        const gamesContainer = document.getElementById('games-container');
-        const leaderboardBody = document.getElementById('leaderboard-body');
-        
-        // Connection status
-        socket.on('connect', () => {
-            connectionStatus.textContent = 'Connected';
-            connectionStatus.className = 'connected';
-            console.log('Connected to tournament server');
-        });
-        
-        socket.on('connect_error', (error) => {
-            console.error('Connection failed:', error);
-            connectionStatus.textContent = 'Connection Failed';
-            connectionStatus.className = 'disconnected';
-        });
-        
-        socket.on('disconnect', () => {
-            connectionStatus.textContent = 'Disconnected';
-            connectionStatus.className = 'disconnected';
-            console.log('Disconnected from tournament server');
-        });
-        
-        // Tournament status updates
-        socket.on('tournament_status', (data) => {
-            console.log('Tournament status:', data);
-            updateTournamentStatus(data.status);
-            clientCount.textContent = data.connected_clients || 0;
-        });
-        
-        // Game updates
-        socket.on('game_update', (data) => {
-            console.log('Game update received:', data);
-            updateGameDisplay(data.game_id, data.data);
-        });
-        
-        // Game state updates (for real-time Catanatron UI refresh)
-        socket.on('game_state_update', (data) => {
-            console.log('Game state update received:', data);
-            // Store the latest game state for polling
-            window.latestGameState = data.state;
-            window.lastUpdateTime = Date.now();
-            
-            // Trigger custom event for advanced refresh mechanisms
-            if (window.location.hostname === 'localhost' && window.location.port === '3002') {
-                window.dispatchEvent(new CustomEvent('gameStateUpdate', {
-                    detail: { gameId: data.game_id, state: data.state }
-                }));
-            }
-        });
-        
-        // Auto-refresh mechanism for Catanatron UI
-        if (window.location.hostname === 'localhost' && window.location.port === '3002') {
-            console.log('Setting up auto-refresh for Catanatron UI');
-            
-            // Method 1: Simple page refresh when updates occur
-            let lastRefresh = 0;
-            setInterval(() => {
-                if (window.lastUpdateTime && window.lastUpdateTime > lastRefresh && Date.now() - window.lastUpdateTime < 10000) {
-                    console.log('Refreshing Catanatron UI with new game state');
-                    lastRefresh = Date.now();
-                    window.location.reload();
-                }
-            }, 3000); // Check every 3 seconds
-            
-            // Method 2: Try to intercept and refresh React state (more advanced)
-            // This attempts to trigger a re-render by dispatching a custom event
-            window.addEventListener('gameStateUpdate', (event) => {
-                console.log('Game state update event received', event.detail);
-                // Dispatch a fake storage event to trigger React re-renders
-                window.dispatchEvent(new StorageEvent('storage', {
-                    key: 'gameStateUpdate',
-                    newValue: JSON.stringify(event.detail)
-                }));
-            });
-        }
-        
-        // Additional debugging
-        socket.onAny((eventName, ...args) => {
-            console.log('Socket.IO event:', eventName, args);
-        });
-        
-        // Functions
-        function updateTournamentStatus(status) {
-            tournamentStatus.textContent = status.replace('_', ' ');
-            tournamentStatus.className = `status-badge status-${status}`;
-        }
-        
-        function updateGameDisplay(gameId, gameData) {
-            const gameElement = document.getElementById(`game-${gameId}`) || createGameElement(gameId);
-            
-            gameElement.innerHTML = `
-                <div class="game-id">${gameData.game_id}</div>
-                <div class="game-players">Players: ${gameData.players.join(', ')}</div>
-                <div class="game-status">${gameData.status}</div>
-            `;
-            
-            if (gameData.winner) {
-                gameElement.innerHTML += `<div style="margin-top: 0.5rem;">🏆 Winner: ${gameData.winner.name || gameData.winner}</div>`;
-            }
-            
-            // Add visual game link if available
-            if (gameData.status === 'running' || gameData.status === 'completed') {
-                gameElement.innerHTML += `<div style="margin-top: 0.5rem;">
-                    <a href="http://localhost:3002?gameId=${gameId}" target="_blank" 
-                       style="color: white; text-decoration: underline; font-size: 0.8rem;">
-                       🎮 Watch Visually
-                    </a>
-                </div>`;
-            }
-        }
-        
-        function createGameElement(gameId) {
-            const gameElement = document.createElement('div');
-            gameElement.className = 'game-card';
-            gameElement.id = `game-${gameId}`;
-            gameElement.onclick = () => viewGame(gameId);
-            
-            // Clear "no games" message if it exists
-            if (gamesContainer.children.length === 1 && gamesContainer.firstElementChild.textContent.includes('No games')) {
-                gamesContainer.innerHTML = '';
-            }
-            
-            gamesContainer.appendChild(gameElement);
-            return gameElement;
-        }
-        
-        function viewGame(gameId) {
-            socket.emit('join_game', { game_id: gameId });
-            // Try to open Catanatron GUI or show instructions
-            checkCatanatronStatus(gameId);
-        }
-        
-        async function checkCatanatronStatus(gameId = null) {
-            try {
-                const response = await fetch('http://localhost:3002', { mode: 'no-cors' });
-                // If we get here, Catanatron is running
-                window.open('http://localhost:3002', '_blank');
-                if (gameId) {
-                    alert(`Game ${gameId} - Visual interface opened in new tab`);
-                }
-            } catch (error) {
-                // Catanatron GUI is not running
-                const message = gameId 
-                    ? `Game ${gameId} is running, but visual GUI is not available.` 
-                    : 'Visual GUI is not currently running.';
-                    
-                alert(`${message}\n\nTo start visual interface:\n\n` +
-                      `Option 1 (Docker): docker compose up\n` +
-                      `Option 2 (Manual): Install Node.js 24+ and run:\n` +
-                      `cd catanatron/ui && npm install && npm run start`);
-            }
-        }
-        
-        // Load initial data
-        async function loadCurrentGames() {
-            try {
-                const response = await fetch('/api/tournament/games');
-                const games = await response.json();
-                console.log('Current games from API:', games);
-                
-                // Update games display
-                for (const [gameId, gameData] of Object.entries(games)) {
-                    updateGameDisplay(gameId, gameData);
-                }
-            } catch (error) {
-                console.error('Error loading current games:', error);
-            }
-        }
-        
-        async function loadLeaderboard() {
-            try {
-                const response = await fetch('/api/tournament/leaderboard');
-                const leaderboard = await response.json();
-                
-                if (leaderboard.length > 0) {
-                    leaderboardBody.innerHTML = leaderboard.map((player, index) => `
-                        <tr>
-                            <td>${index + 1}</td>
-                            <td>${player.player}</td>
-                            <td>${player.wins}</td>
-                            <td>${player.games}</td>
-                            <td>${(player.win_rate * 100).toFixed(1)}%</td>
-                        </tr>
-                    `).join('');
-                }
-            } catch (error) {
-                console.error('Error loading leaderboard:', error);
-            }
-        }
-        
-        // Refresh data periodically
-        setInterval(() => {
-            loadLeaderboard();
-            loadCurrentGames();
-        }, 5000);
-        
-        // Load initial data
-        loadLeaderboard();
-        loadCurrentGames();
-    </script>
-</body>
-</html>
-        ''' 
\ No newline at end of file
@@ -2,27 +2,229 @@
 Simple real-time tournament manager using REST API polling instead of Socket.IO.
 
 This module provides a simplified approach to real-time viewing without the complexity
-of WebSocket connections. It uses simple HTTP polling every 15 seconds.
+of WebSocket connections. The page follows the tournament over Server-Sent Events,
+falling back to simple HTTP polling (every 15 seconds by default) while the stream
+is down.
 """
 
-import copy
-import json
+import asyncio
+import atexit
+import gzip
+import hashlib
 import time
 import logging
-from typing import Dict, List, Any, Optional
+import operator
+from logging.handlers import QueueHandler, QueueListener
+import queue
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime
 from pathlib import Path
 from aiohttp import web
 import threading
+import orjson
 
 from catanatron import Game
-from catanatron.models.player import Color
+from catanatron.json import GameEncoder
+from catanatron.models.enums import SETTLEMENT, CITY, ROAD
+from catanatron.models.player import Color, RandomPlayer
+from catanatron.state_functions import get_player_buildings
 
 from .manager import TournamentManager
 from core.llm_player import LLMPlayer
 from core.game_state import GameStateExtractor
 
 
+_GAME_ENCODER = GameEncoder()
+
+# Seat colors, in player order
+_PLAYER_COLORS = (Color.RED, Color.BLUE, Color.WHITE, Color.ORANGE)
+
+# Seconds between keep-alive comments on an idle event stream
+_STREAM_KEEPALIVE_SECONDS = 15
+
+# Seconds the dashboard stream waits after a change before sending, so the burst
+# of changes a running game makes goes out as one event
+_EVENTS_COALESCE_SECONDS = 0.5
+
+# Minimum seconds between periodic backend state logs of the same game
+_BACKEND_LOG_INTERVAL = 0.25
+
+# CORS headers added to every response (and answering every preflight)
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': '*'
+}
+
+# The polling page is read once at import; each manager fills in its poll interval
+# once at init. It has no per-request data, so browsers may reuse it for an hour
+_POLLING_PAGE = (Path(__file__).parent / 'static' / 'polling.html').read_bytes()
+_INDEX_CACHE_CONTROL = 'public, max-age=3600'
+# Response bodies smaller than this are not worth compressing
+_COMPRESS_MIN_BYTES = 1024
+
+
+def _encode_default(obj):
+    """orjson fallback mirroring GameEncoder; tuple subclasses (Actions) become lists."""
+    if isinstance(obj, tuple):
+        return list(obj)
+    return _GAME_ENCODER.default(obj)
+
+
+# (monotonic time, ISO timestamp) of the last formatted _now_iso() value
+_now_iso_cache = (float('-inf'), '')
+
+
+def _now_iso() -> str:
+    """
+    Return the current local time in ISO format, reusing the last value for up to 100ms.
+    
+    Every response and log entry carries a timestamp; formatting a fresh datetime
+    for each one is wasted work under heavy polling.
+    """
+    global _now_iso_cache
+    mono = time.monotonic()
+    cached_mono, cached = _now_iso_cache
+    if mono - cached_mono < 0.1:
+        return cached
+    now = datetime.now().isoformat()
+    _now_iso_cache = (mono, now)
+    return now
+
+
+def _probe_getter(obj: Any, defaults: Dict[str, Any]) -> Callable[[Any], Tuple]:
+    """
+    Build a getter returning the named attributes (or their defaults) as a tuple.
+    
+    Whether each attribute exists is checked once on ``obj``, so objects of the
+    same shape skip the per-call ``getattr`` fallback.
+    """
+    names = tuple(defaults)
+    if all(hasattr(obj, name) for name in names):
+        getter = operator.attrgetter(*names)
+        return getter if len(names) > 1 else lambda o: (getter(o),)
+    if not any(hasattr(obj, name) for name in names):
+        values = tuple(defaults.values())
+        return lambda o: values
+    return lambda o: tuple(getattr(o, name, default) for name, default in defaults.items())
+
+
+def _json(obj: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    """Build a JSON response from a single orjson-encoded body."""
+    return web.Response(body=orjson.dumps(obj), status=status, headers=headers, content_type='application/json')
+
+
+def _encode_game(game: Game) -> Dict[str, Any]:
+    """
+    Encode a Catanatron Game into the dict GameEncoder produces.
+    
+    Values are left for orjson to serialize with ``_encode_default``, so there is
+    no json.dumps/json.loads round trip.
+    """
+    return _GAME_ENCODER.default(game)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its caller instead of flushing every record."""
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers only once the queue is drained.
+    
+    Records that arrive in a burst are written with one flush instead of one each.
+    """
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+# Writer thread behind the shared 'backend_states' logger, one per process
+_backend_log_listener: Optional[QueueListener] = None
+
+
+def _stop_backend_logging() -> None:
+    """Stop the backend state log writer, writing out any queued records."""
+    global _backend_log_listener
+    if _backend_log_listener is not None:
+        _backend_log_listener.stop()
+        for handler in _backend_log_listener.handlers:
+            handler.close()
+        _backend_log_listener = None
+
+
+atexit.register(_stop_backend_logging)
+
+
+class _LoggingExecute:
+    """
+    Replacement for ``Game.execute`` that counts actions and logs backend states.
+    
+    Actions are applied holding the game's lock, so state encodes on the web
+    server's executor never see the game mid-action.
+    
+    A slotted callable rather than a closure: it runs once per action, and slot
+    reads are cheaper than ``nonlocal`` cell access.
+    """
+    
+    __slots__ = ('manager', 'game_id', 'game', 'lock', 'execute', 'action_count', 'has_turn')
+    
+    def __init__(self, manager: 'SimpleRealtimeTournamentManager', game_id: str, game: Game, lock: threading.Lock):
+        self.manager = manager
+        self.game_id = game_id
+        self.game = game
+        self.lock = lock
+        self.execute = game.execute
+        self.action_count = 0
+        # The state object lives for the whole game, so probe its 'turn' once
+        self.has_turn = hasattr(game.state, 'turn')
+    
+    def __call__(self, action):
+        manager = self.manager
+        game_id = self.game_id
+        # The version is bumped with the action, so an encode under the lock
+        # always caches the state that matches its version
+        with self.lock:
+            result = self.execute(action)
+            manager._mark_state_changed(game_id)
+        self.action_count += 1
+        action_count = self.action_count
+        
+        # Log backend state every 2 actions, at most every _BACKEND_LOG_INTERVAL
+        # seconds so fast (non-LLM) games don't spend their time logging
+        if action_count % 2 == 0 and game_id in manager.current_games:
+            try:
+                state = self.game.state
+                turn = state.turn if self.has_turn else action_count // 10
+                game_data = manager.current_games[game_id]
+                if game_data.get('current_turn') != turn:
+                    game_data['current_turn'] = turn
+                    game_data['action_count'] = action_count
+                    manager._mark_state_changed(game_id, summary_changed=True)
+                
+                # Log detailed backend state for debugging
+                now = time.monotonic()
+                if now - manager._last_log_ts.get(game_id, 0.0) > _BACKEND_LOG_INTERVAL:
+                    manager._log_backend_state(game_id, state, action_count)
+                    manager._last_log_ts[game_id] = now
+                
+            except Exception as e:
+                manager.logger.debug(f"State logging error: {e}")
+        
+        return result
+
+
 class SimpleRealtimeTournamentManager(TournamentManager):
     """
     Simplified real-time tournament manager using REST API polling.
@@ -31,7 +233,9 @@ class SimpleRealtimeTournamentManager(TournamentManager):
     - Simple HTTP endpoints for game state
     - Backend state logging for debugging  
     - No WebSocket complexity
-    - 15-second polling from frontend
+    - Server-Sent Events stream of tournament status, games and leaderboard
+    - Configurable fallback polling from frontend (15 seconds by default)
+    - Conditional GETs (ETag / If-None-Match) on game endpoints
     """
     
     def __init__(
@@ -39,7 +243,9 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         name: str = "Simple Real-time Tournament",
         output_dir: str = "tournament_results",
         log_level: str = "INFO",
-        web_port: int = 8080
+        web_port: int = 8080,
+        poll_interval_ms: int = 15000,
+        catanatron_ui_url: str = "http://localhost:3002"
     ):
         """
         Initialize simple real-time tournament manager.
@@ -49,29 +255,78 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             output_dir: Directory to save results and logs
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
             web_port: Port for the web interface
+            poll_interval_ms: How often the web page polls the API, in milliseconds
+            catanatron_ui_url: URL of the Catanatron visual UI linked from the page
         """
         super().__init__(name, output_dir, log_level)
         
         # Web interface configuration
         self.web_port = web_port
+        self.poll_interval_ms = poll_interval_ms
+        self.catanatron_ui_url = catanatron_ui_url
         
-        # Real-time state tracking
+        # Real-time state tracking. current_games only holds JSON-serializable
+        # fields; the live Catanatron Game objects are kept apart in _games
         self.current_games = {}  # game_id -> game_state
+        self._games: Dict[str, Game] = {}  # game_id -> Game
+        # Held by the game thread while it applies an action, and by encodes of that game
+        self._game_locks: Dict[str, threading.Lock] = {}
         self.tournament_status = "not_started"
         self.tournament_info = {}
         
+        # State version per game, bumped on every action and status change, and the
+        # last encoded /api/games/{game_id} body (without its timestamp) per version
+        self._state_versions = {}    # game_id -> int
+        self._game_state_cache = {}  # game_id -> (version, bytes)
+        # One encode at a time per game, so concurrent polls share it
+        self._encode_locks: Dict[str, asyncio.Lock] = {}
+        # Bumped when a game's current_games summary changes, for the /api/games ETag.
+        # It is also the sequence number for game deltas: the value at each game's last change
+        self._games_version = 0
+        self._game_seqs: Dict[str, int] = {}
+        # Bumped when the tournament status or the leaderboard may have changed
+        self._status_version = 0
+        self._leaderboard_version = 0
+        # Leaderboard rows and their /api/leaderboard body (without its timestamp),
+        # computed once per leaderboard version
+        self._leaderboard_cache: Optional[Tuple[int, List[Dict[str, Any]], bytes]] = None
+        # Dashboard sections, as served by /api/dashboard and /api/events:
+        # name -> (current version, payload builder)
+        self._dashboard_sections = {
+            'status': (lambda: self._status_version, self._status_payload),
+            'games': (lambda: self._games_version, self._games_payload),
+            'leaderboard': (lambda: self._leaderboard_version, self._leaderboard_payload)
+        }
+        # Sections that can be sent as a delta since a version the client has seen
+        self._dashboard_deltas = {
+            'games': self._games_delta
+        }
+        
+        # Event set (from the game thread, via the web loop) when the dashboard changes;
+        # it is replaced each time it fires so every /api/events stream wakes exactly once
+        self._dashboard_event: Optional[asyncio.Event] = None
+        self.web_loop = None
+        
         # Web server
         self.app = web.Application()
         
         # Game state extractor for debugging logs
         self.game_state_extractor = GameStateExtractor()
         
-        # Backend state logging
+        # Backend state logging, and when each game's state was last logged (monotonic)
         self.backend_logger = self._setup_backend_logging()
+        self._last_log_ts: Dict[str, float] = {}
+        # (turn, robber_coordinate, dice) getter, probed on the first logged state
+        self._log_state_fields: Optional[Callable[[Any], Tuple]] = None
         
         # Setup web routes
         self._setup_web_routes()
         
+        # The polling page is rendered once; serving it costs no string work
+        self._index_bytes = _POLLING_PAGE.replace(b'__POLL_INTERVAL_MS__', str(poll_interval_ms).encode())
+        self._index_etag = f'W/"{hashlib.sha1(self._index_bytes).hexdigest()[:16]}"'
+        self._index_gzip = gzip.compress(self._index_bytes, compresslevel=9, mtime=0)
+        
         self.logger.info(f"Simple real-time tournament manager initialized on port {web_port}")
     
     def _setup_backend_logging(self):
@@ -81,16 +336,24 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         backend_logger = logging.getLogger('backend_states')
         backend_logger.setLevel(logging.INFO)
         
-        # Remove existing handlers to avoid duplicates
+        # Replace any earlier manager's setup: stop its writer, closing its file,
+        # and remove its handlers to avoid duplicates
+        global _backend_log_listener
+        _stop_backend_logging()
         for handler in backend_logger.handlers[:]:
             backend_logger.removeHandler(handler)
+            handler.close()
         
-        handler = logging.FileHandler(backend_log_path)
-        formatter = logging.Formatter(
-            '%(asctime)s - BACKEND_STATE - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        backend_logger.addHandler(handler)
+        # Records are written by a listener thread, so the game thread never
+        # waits on the disk
+        file_handler = _BufferedFileHandler(backend_log_path)
+        # Each entry carries its own timestamp, so lines are bare JSON (JSONL)
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        log_queue = queue.SimpleQueue()
+        backend_logger.addHandler(QueueHandler(log_queue))
+        
+        _backend_log_listener = _BatchingQueueListener(log_queue, file_handler)
+        _backend_log_listener.start()
         
         # Prevent propagation to avoid duplicate logs
         backend_logger.propagate = False
@@ -107,6 +370,9 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         self.app.router.add_get('/api/games', self._get_games)
         self.app.router.add_get('/api/games/{game_id}', self._get_game_state)
         self.app.router.add_get('/api/leaderboard', self._get_leaderboard)
+        self.app.router.add_get('/api/events', self._stream_events)
+        self.app.router.add_get('/api/dashboard', self._get_dashboard)
+        self.app.router.add_get('/api/tournament/config', self._get_tournament_config)
         
         # Catanatron UI compatibility endpoints
         self.app.router.add_post('/api/games', self._create_or_list_games)
@@ -118,67 +384,299 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         @web.middleware
         async def cors_middleware(request, handler):
             if request.method == 'OPTIONS':
-                response = web.Response()
-            else:
-                response = await handler(request)
+                return web.Response(headers=_CORS_HEADERS)
             
-            response.headers['Access-Control-Allow-Origin'] = '*'
-            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-            response.headers['Access-Control-Allow-Headers'] = '*'
+            response = await handler(request)
+            # Streamed responses were prepared with their headers already
+            if not response.prepared:
+                response.headers.update(_CORS_HEADERS)
             return response
         
         self.app.middlewares.append(cors_middleware)
+        
+        # Gzip JSON bodies for clients that accept it (aiohttp compresses the
+        # larger ones in an executor); responses that set their own encoding are
+        # left alone
+        @web.middleware
+        async def compression_middleware(request, handler):
+            response = await handler(request)
+            if (isinstance(response, web.Response) and not response.prepared
+                    and 'Content-Encoding' not in response.headers
+                    and isinstance(response.body, bytes) and len(response.body) >= _COMPRESS_MIN_BYTES):
+                response.enable_compression()
+                response.headers['Vary'] = 'Accept-Encoding'
+            return response
+        
+        self.app.middlewares.append(compression_middleware)
     
     async def _serve_index(self, request):
-        """Serve the main tournament page with polling."""
-        html_content = self._generate_polling_html()
-        return web.Response(text=html_content, content_type='text/html')
+        """Serve the main tournament page with polling, gzipped ahead of time."""
+        headers = {'Cache-Control': _INDEX_CACHE_CONTROL, 'ETag': self._index_etag, 'Vary': 'Accept-Encoding'}
+        if request.headers.get('If-None-Match') == self._index_etag:
+            return web.Response(status=304, headers=headers)
+        if 'gzip' in request.headers.get('Accept-Encoding', '').lower():
+            headers['Content-Encoding'] = 'gzip'
+            return web.Response(body=self._index_gzip, content_type='text/html', charset='utf-8', headers=headers)
+        return web.Response(body=self._index_bytes, content_type='text/html', charset='utf-8', headers=headers)
     
-    async def _get_status(self, request):
-        """API endpoint for tournament status."""
-        return web.json_response({
+    async def _get_tournament_config(self, request):
+        """API endpoint for the page's configuration."""
+        return _json({
+            'catanatron_ui_url': self.catanatron_ui_url
+        })
+    
+    def _status_payload(self) -> Dict[str, Any]:
+        """Tournament status, as served by /api/status and the 'status' event."""
+        return {
             'status': self.tournament_status,
             'tournament_info': self.tournament_info,
-            'current_games': list(self.current_games.keys()),
-            'timestamp': datetime.now().isoformat()
-        })
+            'current_games': list(self.current_games),
+            'timestamp': _now_iso()
+        }
+    
+    def _games_payload(self) -> Dict[str, Any]:
+        """All current games, as served by /api/games and the 'games' event."""
+        return {
+            'seq': self._games_version,
+            'games': self.current_games,
+            'timestamp': _now_iso()
+        }
+    
+    def _games_delta(self, since: int) -> Dict[str, Any]:
+        """
+        Games changed or removed after sequence number ``since``.
+        
+        A ``since`` ahead of the current sequence (the server restarted) gets the
+        full payload instead, so the client starts over.
+        """
+        # Read the sequence first: a game changing meanwhile is sent again next time
+        seq = self._games_version
+        if since > seq:
+            return self._games_payload()
+        
+        changed = []
+        removed = []
+        for game_id, game_seq in list(self._game_seqs.items()):
+            if game_seq <= since:
+                continue
+            game = self.current_games.get(game_id)
+            if game is None:
+                removed.append(game_id)
+            else:
+                changed.append(game)
+        return {
+            'seq': seq,
+            'changed': changed,
+            'removed': removed,
+            'timestamp': _now_iso()
+        }
+    
+    @staticmethod
+    def _since_param(request) -> Optional[int]:
+        """The ``?since=<seq>`` query parameter, or None when absent or invalid."""
+        try:
+            return int(request.query['since'])
+        except (KeyError, ValueError):
+            return None
+    
+    def _leaderboard_payload(self) -> Dict[str, Any]:
+        """Tournament leaderboard, as served by /api/leaderboard and the 'leaderboard' event."""
+        return {
+            'leaderboard': self._cached_leaderboard()[0],
+            'timestamp': _now_iso()
+        }
+    
+    def _cached_leaderboard(self) -> Tuple[List[Dict[str, Any]], bytes]:
+        """The leaderboard rows and encoded body, recomputed only when its version changed."""
+        # Read the version first: a change while computing is picked up next time
+        version = self._leaderboard_version
+        cache = self._leaderboard_cache
+        if cache is None or cache[0] != version:
+            leaderboard = self.get_leaderboard()
+            cache = self._leaderboard_cache = (version, leaderboard, orjson.dumps({'leaderboard': leaderboard}))
+        return cache[1], cache[2]
+    
+    async def _get_status(self, request):
+        """API endpoint for tournament status."""
+        return _json(self._status_payload())
     
     async def _get_games(self, request):
-        """API endpoint for all current games."""
-        # Create serializable version (exclude catanatron_state)
-        serializable_games = {}
-        for game_id, game_data in self.current_games.items():
-            serializable_data = {k: v for k, v in game_data.items() if k != 'catanatron_state'}
-            serializable_games[game_id] = serializable_data
-        
-        return web.json_response({
-            'games': serializable_games,
-            'timestamp': datetime.now().isoformat()
+        """
+        API endpoint for all current games.
+        
+        ``?since=<seq>`` returns only the games changed or removed after that
+        sequence number, as ``{seq, changed, removed}``.
+        """
+        etag = f'W/"games-{self._games_version}"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        
+        since = self._since_param(request)
+        payload = self._games_payload() if since is None else self._games_delta(since)
+        return _json(payload, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+    
+    async def _get_dashboard(self, request):
+        """
+        API endpoint for the whole dashboard: status, games and leaderboard in one body.
+        
+        ``?want=status,games`` limits the body to the listed sections, and
+        ``?since=<seq>`` sends the games as a delta (see ``_get_games``). The ETag
+        combines the versions of the sections sent, so an unchanged dashboard is
+        answered with an empty 304 without building any of them.
+        """
+        want = request.query.get('want')
+        if want:
+            names = [name for name in want.split(',') if name in self._dashboard_sections]
+        else:
+            names = list(self._dashboard_sections)
+        
+        etag = 'W/"dashboard-' + '-'.join(
+            f'{name}{self._dashboard_sections[name][0]()}' for name in names
+        ) + '"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        
+        since = self._since_param(request)
+        try:
+            return _json({
+                name: (
+                    self._dashboard_sections[name][1]() if since is None or name not in self._dashboard_deltas
+                    else self._dashboard_deltas[name](since)
+                ) for name in names
+            }, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+        except Exception as e:
+            return _json({
+                'error': str(e),
+                'timestamp': _now_iso()
+            }, status=500)
+    
+    async def _stream_events(self, request):
+        """
+        Server-Sent Events stream of the dashboard.
+        
+        Sends named 'status', 'games' and 'leaderboard' events, each with the same
+        body as its polling endpoint, when the stream opens and then whenever that
+        part changes. After the first, 'games' events are deltas since the last one;
+        they carry the sequence as their event id, so a reconnecting EventSource
+        (sending ``Last-Event-ID``) resumes with a delta too.
+        """
+        # Headers are sent by prepare(), before the CORS middleware sees the response
+        response = web.StreamResponse(headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            **_CORS_HEADERS
         })
+        await response.prepare(request)
+        
+        sent_versions = {}
+        try:
+            sent_versions['games'] = int(request.headers['Last-Event-ID'])
+        except (KeyError, ValueError):
+            pass
+        # A client that went away ends its stream
+        try:
+            while True:
+                # Take the event before reading the versions so a change made while
+                # writing still wakes the wait below
+                if self._dashboard_event is None:
+                    self._dashboard_event = asyncio.Event()
+                event = self._dashboard_event
+                
+                for name, (get_version, get_payload) in self._dashboard_sections.items():
+                    version = get_version()
+                    sent = sent_versions.get(name)
+                    if sent == version:
+                        continue
+                    try:
+                        delta = self._dashboard_deltas.get(name)
+                        payload = get_payload() if sent is None or delta is None else delta(sent)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to build {name} event: {e}")
+                        continue
+                    event_id = f'id: {payload["seq"]}\n' if name in self._dashboard_deltas else ''
+                    await response.write(f'{event_id}event: {name}\ndata: '.encode() + orjson.dumps(payload) + b'\n\n')
+                    sent_versions[name] = version
+                
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    await response.write(b': keep-alive\n\n')
+                    continue
+                await asyncio.sleep(_EVENTS_COALESCE_SECONDS)
+        except ConnectionResetError:
+            pass
+        return response
     
     async def _get_game_state(self, request):
         """API endpoint for specific game state."""
         game_id = request.match_info['game_id']
         if game_id not in self.current_games:
-            return web.json_response({'error': 'Game not found'}, status=404)
+            return _json({'error': 'Game not found'}, status=404)
         
-        game_data = self.current_games[game_id]
-        catanatron_game = game_data.get('catanatron_game')
-        
-        if not catanatron_game:
-            return web.json_response({
+        if game_id not in self._games:
+            return _json({
                 'error': 'No game available',
                 'game_id': game_id
             }, status=404)
         
+        # Unchanged states are answered with an empty 304
+        etag = f'W/"{game_id}-{self._state_versions.get(game_id, 0)}"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        
         try:
-            # Use GameEncoder properly with the Game object
-            from catanatron.json import GameEncoder
-            import json
+            body = await self._encode_game_state_once(game_id)
+        except Exception as e:
+            self.logger.error(f"Failed to get game state for {game_id}: {e}")
+            import traceback
+            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            return _json({
+                'error': 'Failed to get game state',
+                'details': str(e)
+            }, status=500)
+        
+        # A plain Response (not streamed) so the compression middleware can gzip it
+        return web.Response(
+            body=body[:-1] + self._timestamp_tail(),
+            content_type='application/json',
+            headers={'ETag': etag, 'Cache-Control': 'no-cache'}
+        )
+    
+    async def _encode_game_state_once(self, game_id: str) -> bytes:
+        """
+        Get a game's encoded state, encoding each state version at most once.
+        
+        Cold encodes run in the default executor so the web loop keeps serving;
+        concurrent requests for the same game wait on one lock and then reuse the
+        cached body instead of encoding it again.
+        """
+        version = self._state_versions.get(game_id, 0)
+        cached = self._game_state_cache.get(game_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        lock = self._encode_locks.setdefault(game_id, asyncio.Lock())
+        async with lock:
+            # _encode_game_state checks the cache again, so waiters reuse the first encode
+            return await asyncio.get_running_loop().run_in_executor(None, self._encode_game_state, game_id)
+    
+    def _encode_game_state(self, game_id: str) -> bytes:
+        """
+        Encode a game's state with its tournament metadata (no timestamp), cached per state version.
+        
+        Runs off the game thread, so it holds the game's lock: the encoded dict still
+        refers to the live state's lists and dicts, and the game must not change
+        until they have been dumped.
+        """
+        with self._game_locks[game_id]:
+            # Repeated polls between state changes reuse the last encode
+            version = self._state_versions.get(game_id, 0)
+            cached = self._game_state_cache.get(game_id)
+            if cached is not None and cached[0] == version:
+                return cached[1]
             
-            # This is the correct way to use GameEncoder
-            json_string = json.dumps(catanatron_game, cls=GameEncoder)
-            encoded_state = json.loads(json_string)
+            game_data = self.current_games[game_id]
+            encoded_state = _encode_game(self._games[game_id])
             
             # Add tournament-specific metadata
             encoded_state.update({
@@ -188,48 +686,107 @@ class SimpleRealtimeTournamentManager(TournamentManager):
                 'player_info': game_data.get('player_info', []),
                 'status': game_data.get('status', 'running'),
                 'winner': game_data.get('winner'),
-                'start_time': game_data.get('start_time'),
-                'timestamp': datetime.now().isoformat()
+                'start_time': game_data.get('start_time')
             })
             
-            return web.json_response(encoded_state)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get game state for {game_id}: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            return web.json_response({
-                'error': 'Failed to get game state',
-                'details': str(e)
-            }, status=500)
+            body = orjson.dumps(encoded_state, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+            self._game_state_cache[game_id] = (version, body)
+        return body
+    
+    def _timestamp_tail(self) -> bytes:
+        """Closing bytes for a cached body (sent without its '}'): the current timestamp."""
+        return b',"timestamp":' + orjson.dumps(_now_iso()) + b'}'
+    
+    def _mark_state_changed(self, game_id: str, summary_changed: bool = False):
+        """
+        Bump a game's state version, invalidating its cached state body.
+        
+        ``summary_changed`` means its current_games entry changed too: the games
+        sequence number is bumped and the dashboard streams are woken. Plain actions
+        leave it alone, so the games section only changes with a game's summary.
+        """
+        self._state_versions[game_id] = self._state_versions.get(game_id, 0) + 1
+        if summary_changed:
+            # Record the game's sequence number before publishing it, so a delta
+            # reading the new sequence always sees this game as changed
+            seq = self._games_version + 1
+            self._game_seqs[game_id] = seq
+            self._games_version = seq
+            if self.web_loop is not None:
+                self.web_loop.call_soon_threadsafe(self._notify_dashboard_changed)
+    
+    def _mark_status_changed(self):
+        """Bump the tournament status version and wake the dashboard streams."""
+        self._status_version += 1
+        if self.web_loop is not None:
+            self.web_loop.call_soon_threadsafe(self._notify_dashboard_changed)
+    
+    def _mark_leaderboard_changed(self):
+        """Bump the leaderboard version and wake the dashboard streams."""
+        self._leaderboard_version += 1
+        if self.web_loop is not None:
+            self.web_loop.call_soon_threadsafe(self._notify_dashboard_changed)
+    
+    def _notify_dashboard_changed(self):
+        """Wake every dashboard stream (runs on the web loop)."""
+        event, self._dashboard_event = self._dashboard_event, None
+        if event is not None:
+            event.set()
     
     async def _get_leaderboard(self, request):
-        """API endpoint for tournament leaderboard."""
+        """
+        API endpoint for tournament leaderboard.
+        
+        Clients accepting ``application/x-ndjson`` get one player per line,
+        written as it is encoded, so the first rows can render before the last.
+        Both are built from the cached leaderboard, and the JSON body is answered
+        with an empty 304 while the leaderboard version is unchanged.
+        """
+        ndjson = 'application/x-ndjson' in request.headers.get('Accept', '')
+        etag = f'W/"leaderboard-{self._leaderboard_version}"'
+        if not ndjson and request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        
         try:
-            leaderboard = self.get_leaderboard()
-            return web.json_response({
-                'leaderboard': leaderboard,
-                'timestamp': datetime.now().isoformat()
-            })
+            leaderboard, body = self._cached_leaderboard()
+            if not ndjson:
+                return web.Response(
+                    body=body[:-1] + self._timestamp_tail(),
+                    content_type='application/json',
+                    headers={'ETag': etag, 'Cache-Control': 'no-cache'}
+                )
         except Exception as e:
-            return web.json_response({
+            return _json({
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }, status=500)
+        
+        # Headers are sent by prepare(), before the CORS middleware sees the response
+        response = web.StreamResponse(headers={
+            'Content-Type': 'application/x-ndjson',
+            'Cache-Control': 'no-cache',
+            **_CORS_HEADERS
+        })
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for row in leaderboard:
+            await response.write(orjson.dumps(row) + b'\n')
+        await response.write_eof()
+        return response
     
     async def _create_or_list_games(self, request):
         """Catanatron UI compatibility - handle game creation requests."""
         self.logger.info(f"Game creation/listing requested from Catanatron UI")
         
         # Return the first available tournament game
-        if self.current_games:
-            first_game_id = list(self.current_games.keys())[0]
-            return web.json_response({
+        first_game_id = next(iter(self.current_games), None)
+        if first_game_id is not None:
+            return _json({
                 'game_id': first_game_id,
                 'message': 'Connected to tournament game'
             })
         else:
-            return web.json_response({
+            return _json({
                 'error': 'No active tournament games',
                 'message': 'Start a tournament to see games here'
             }, status=404)
@@ -238,14 +795,14 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         """Catanatron UI compatibility - get game state in UI format."""
         game_id = request.match_info['game_id']
         self.logger.info(f"UI requesting game state for: {game_id}")
-        self.logger.info(f"Available games: {list(self.current_games.keys())}")
+        self.logger.info(f"Available games: {list(self.current_games)}")
         
         if game_id not in self.current_games:
             self.logger.warning(f"Game {game_id} not found in current games")
-            return web.json_response({
+            return _json({
                 'error': 'Game not found',
                 'game_id': game_id,
-                'available_games': list(self.current_games.keys())
+                'available_games': list(self.current_games)
             }, status=404)
         
         return await self._get_game_state(request)
@@ -263,27 +820,38 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         if game_id in self.current_games:
             return await self._get_game_state(request)
         else:
-            return web.json_response({
+            return _json({
                 'error': 'Game not found'
             }, status=404)
     
     def start_web_server(self):
         """Start the web server in a background thread."""
+        started = threading.Event()
+        
+        async def serve():
+            # No access log: pollers would otherwise write a line per request
+            runner = web.AppRunner(self.app, access_log=None, handle_signals=False)
+            await runner.setup()
+            site = web.TCPSite(runner, '0.0.0.0', self.web_port)
+            await site.start()
+            started.set()
+            while True:
+                await asyncio.sleep(3600)
+        
         def run_server():
+            # The game thread signals state changes into this loop
+            loop = asyncio.new_event_loop()
+            self.web_loop = loop
             try:
-                web.run_app(
-                    self.app, 
-                    host='0.0.0.0', 
-                    port=self.web_port,
-                    handle_signals=False
-                )
+                loop.run_until_complete(serve())
             except Exception as e:
                 self.logger.error(f"Web server error: {e}")
+                started.set()
         
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
         
-        time.sleep(2)  # Give server time to start
+        started.wait(timeout=10)  # Wait until the server listens (or failed to)
         self.logger.info(f"Simple web server started at http://localhost:{self.web_port}")
         return server_thread
     
@@ -306,8 +874,9 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             "format": tournament_format,
             "games_per_matchup": games_per_matchup,
             "players": list(self.players.keys()),
-            "start_time": datetime.now().isoformat()
+            "start_time": _now_iso()
         }
+        self._mark_status_changed()
         
         try:
             # Run tournament with state logging
@@ -315,11 +884,13 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             
             self.tournament_info.update(results.get("tournament_info", {}))
             self.tournament_status = "completed"
+            self._mark_status_changed()
             
             return results
             
         except Exception as e:
             self.tournament_status = "failed"
+            self._mark_status_changed()
             self.logger.error(f"Tournament failed: {e}")
             raise
     
@@ -340,10 +911,11 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             'game_id': game_id,
             'players': player_names,
             'status': 'starting',
-            'start_time': datetime.now().isoformat(),
+            'start_time': _now_iso(),
             'current_turn': 0,
-            'catanatron_game': None  # Will store the Game object
+            'action_count': 0
         }
+        self._mark_state_changed(game_id, summary_changed=True)
         
         self.logger.info(f"Starting game {game_id} with players: {player_names}")
         
@@ -357,8 +929,11 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             'status': 'completed' if result.get('winner') else 'failed',
             'winner': result.get('winner'),
             'duration': result.get('duration_seconds'),
-            'end_time': datetime.now().isoformat()
+            'end_time': _now_iso()
         })
+        self._mark_state_changed(game_id, summary_changed=True)
+        # A finished game can change the standings
+        self._mark_leaderboard_changed()
         
         return result
     
@@ -372,43 +947,35 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         """Play a game with state logging for debugging."""
         game_id = f"M{matchup_idx:02d}_G{game_num:02d}"
         
-        # Import required classes
-        from catanatron import Game
-        from catanatron.models.player import Color, RandomPlayer
-        from core.llm_player import LLMPlayer
-        import time
-        from datetime import datetime
-        
-        colors = [Color.RED, Color.BLUE, Color.WHITE, Color.ORANGE]
-        
         # Create players
         players = []
         player_info = []
+        add_player = players.append
+        add_info = player_info.append
+        registered = self.players
         
-        for i, player_name in enumerate(player_names):
+        for color, player_name in zip(_PLAYER_COLORS, player_names):
             if player_name.startswith("Random_"):
-                player = RandomPlayer(colors[i])
-                players.append(player)
-                player_info.append({
+                add_player(RandomPlayer(color))
+                add_info({
                     "name": player_name,
                     "type": "random",
-                    "color": colors[i].value,
+                    "color": color.value,
                     "model": "RandomPlayer"
                 })
             else:
-                llm_client, config = self.players[player_name]
-                player = LLMPlayer(
-                    color=colors[i],
+                llm_client, config = registered[player_name]
+                add_player(LLMPlayer(
+                    color=color,
                     llm_client=llm_client,
                     name=player_name,
                     **config
-                )
-                players.append(player)
-                player_info.append({
+                ))
+                add_info({
                     "name": player_name,
                     "type": "llm",
-                    "color": colors[i].value,
-                    "model": llm_client.model_name if hasattr(llm_client, 'model_name') else 'unknown'
+                    "color": color.value,
+                    "model": getattr(llm_client, 'model_name', 'unknown')
                 })
         
         try:
@@ -421,36 +988,19 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             game = Game(players)
             start_time = time.time()
             
-            # Store initial game state immediately after game creation
+            # Store initial game state immediately after game creation. Only the live
+            # Game reference is kept, never a copy of it or its state: readers see it
+            # through the state version, and snapshots come from the encoded bytes
+            # cached per version (_game_state_cache), encoded under the game's lock
+            game_lock = threading.Lock()
             if game_id in self.current_games:
-                self.current_games[game_id]['catanatron_game'] = game  # Store the Game object, not State
+                self._game_locks[game_id] = game_lock
+                self._games[game_id] = game
+                self._mark_state_changed(game_id, summary_changed=True)
                 self.logger.info(f"Captured initial game for game {game_id}")
             
-            # Store original execute method for logging
-            original_execute = game.execute
-            action_count = 0
-            
-            def execute_with_logging(action):
-                nonlocal action_count
-                result = original_execute(action)
-                action_count += 1
-                
-                # Log backend state every 2 actions for more frequent updates
-                if action_count % 2 == 0 and game_id in self.current_games:
-                    try:
-                        # Keep game reference updated (no need to extract, just keep reference)
-                        self.current_games[game_id]['catanatron_game'] = game
-                        self.current_games[game_id]['current_turn'] = getattr(game.state, 'turn', action_count // 10)
-                        
-                        # Log detailed backend state for debugging
-                        self._log_backend_state(game_id, game.state, action_count)
-                        
-                    except Exception as e:
-                        self.logger.debug(f"State logging error: {e}")
-                
-                return result
-            
-            # Hook the execute method
+            # Hook the execute method to count actions and log backend states
+            execute_with_logging = _LoggingExecute(self, game_id, game, game_lock)
             game.execute = execute_with_logging
             
             # Play the game
@@ -459,8 +1009,6 @@ class SimpleRealtimeTournamentManager(TournamentManager):
             
             # Final game update
             if game_id in self.current_games:
-                self.current_games[game_id]['catanatron_game'] = game
-                
                 winner_info = None
                 if winner_color:
                     winner_info = {
@@ -471,9 +1019,12 @@ class SimpleRealtimeTournamentManager(TournamentManager):
                 self.current_games[game_id]['winner'] = winner_info
                 self.current_games[game_id]['status'] = 'completed' if winner_color else 'tie'
                 self.current_games[game_id]['duration'] = game_duration
+                self.current_games[game_id]['action_count'] = execute_with_logging.action_count
+                self._mark_state_changed(game_id, summary_changed=True)
                 
                 # Final backend state log
-                self._log_backend_state(game_id, game.state, action_count, final=True)
+                self._log_backend_state(game_id, game.state, execute_with_logging.action_count, final=True)
+                self._last_log_ts.pop(game_id, None)
             
             # Build result
             result = {
@@ -483,15 +1034,17 @@ class SimpleRealtimeTournamentManager(TournamentManager):
                 "players": player_info,
                 "winner": winner_info,
                 "duration_seconds": game_duration,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             
             return result
             
         except Exception as e:
             self.logger.error(f"Game {game_id} failed: {e}")
+            self._last_log_ts.pop(game_id, None)
             if game_id in self.current_games:
                 self.current_games[game_id]['status'] = 'failed'
+                self._mark_state_changed(game_id, summary_changed=True)
             raise
     
     def _log_backend_state(self, game_id: str, game_state, action_count: int, final: bool = False):
@@ -499,21 +1052,22 @@ class SimpleRealtimeTournamentManager(TournamentManager):
         try:
             # Extract readable game state
             current_player = game_state.current_color()
-            turn_num = getattr(game_state, 'turn', 0)
+            if self._log_state_fields is None:
+                self._log_state_fields = _probe_getter(
+                    game_state, {'turn': 0, 'robber_coordinate': None, 'dice': None}
+                )
+            turn_num, robber_position, dice = self._log_state_fields(game_state)
             
             # Get building counts for each player
             building_info = {}
-            for color in [Color.RED, Color.BLUE, Color.WHITE, Color.ORANGE]:
-                from catanatron.state_functions import get_player_buildings
-                from catanatron.models.enums import SETTLEMENT, CITY, ROAD
-                
-                settlements = list(get_player_buildings(game_state, color, SETTLEMENT))
-                cities = list(get_player_buildings(game_state, color, CITY))
-                roads = list(get_player_buildings(game_state, color, ROAD))
+            for color in _PLAYER_COLORS:
+                # get_player_buildings returns the state's own lists, so nothing is copied
+                settlements = get_player_buildings(game_state, color, SETTLEMENT)
+                roads = get_player_buildings(game_state, color, ROAD)
                 
                 building_info[color.value] = {
                     'settlements': len(settlements),
-                    'cities': len(cities), 
+                    'cities': len(get_player_buildings(game_state, color, CITY)),
                     'roads': len(roads),
                     'settlement_nodes': settlements[:3],  # First 3 for debugging
                     'road_edges': roads[:3]  # First 3 for debugging
@@ -526,322 +1080,14 @@ class SimpleRealtimeTournamentManager(TournamentManager):
                 'turn': turn_num,
                 'current_player': current_player.value,
                 'buildings': building_info,
-                'robber_position': getattr(game_state, 'robber_coordinate', None),
-                'dice': getattr(game_state, 'dice', None),
+                'robber_position': robber_position,
+                'dice': dice,
                 'final': final,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
             
-            # Log as JSON for easy parsing
-            self.backend_logger.info(json.dumps(log_entry, indent=2))
+            # One compact JSON object per line (JSONL) for easy parsing
+            self.backend_logger.info(orjson.dumps(log_entry).decode())
             
         except Exception as e:
             self.logger.warning(f"Failed to log backend state: {e}")
-    
-    def _generate_polling_html(self) -> str:
-        """Generate HTML page with 15-second polling."""
-        return '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Simple CatanBench Tournament</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: #333;
-            min-height: 100vh;
-            padding: 1rem;
-        }
-        
-        .header {
-            background: rgba(255, 255, 255, 0.95);
-            padding: 1rem;
-            border-radius: 12px;
-            margin-bottom: 1rem;
-            text-align: center;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }
-        
-        .status-badge {
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            border-radius: 20px;
-            font-weight: bold;
-            text-transform: uppercase;
-            margin-top: 0.5rem;
-        }
-        
-        .status-not_started { background: #ffeaa7; color: #2d3436; }
-        .status-running { background: #55a3ff; color: white; }
-        .status-completed { background: #00b894; color: white; }
-        .status-failed { background: #e17055; color: white; }
-        
-        .main-content {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 1rem;
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .card {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        }
-        
-        .card h2 {
-            margin-bottom: 1rem;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 0.5rem;
-        }
-        
-        .game-item {
-            background: #f8f9fa;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            border-radius: 8px;
-            border-left: 4px solid #3498db;
-        }
-        
-        .game-item.completed { border-left-color: #00b894; }
-        .game-item.running { border-left-color: #55a3ff; }
-        .game-item.failed { border-left-color: #e17055; }
-        
-        .last-update {
-            color: #666;
-            font-size: 0.9rem;
-            margin-top: 1rem;
-            text-align: center;
-        }
-        
-        .polling-indicator {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            margin-left: 0.5rem;
-        }
-        
-        .polling-active { background: #00b894; }
-        .polling-inactive { background: #ccc; }
-        
-        .leaderboard-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        
-        .leaderboard-table th,
-        .leaderboard-table td {
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        
-        .leaderboard-table th {
-            background: #f8f9fa;
-            font-weight: bold;
-        }
-        
-        @media (max-width: 768px) {
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🏰 Simple CatanBench Tournament</h1>
-        <div class="status-badge" id="tournament-status">Not Started</div>
-        <div class="last-update">
-            Last Update: <span id="last-update">Never</span>
-            <span class="polling-indicator" id="polling-indicator"></span>
-        </div>
-    </div>
-    
-    <div class="main-content">
-        <div class="card">
-            <h2>🎮 Current Games</h2>
-            <div id="games-container">
-                <div style="text-align: center; color: #666; padding: 2rem;">
-                    No games running
-                </div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <h2>🏆 Leaderboard</h2>
-            <div id="leaderboard-container">
-                <table class="leaderboard-table">
-                    <thead>
-                        <tr>
-                            <th>Rank</th>
-                            <th>Player</th>
-                            <th>Wins</th>
-                            <th>Games</th>
-                            <th>Win Rate</th>
-                        </tr>
-                    </thead>
-                    <tbody id="leaderboard-body">
-                        <tr>
-                            <td colspan="5" style="text-align: center; color: #666;">
-                                No data available
-                            </td>
-                        </tr>
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Simple polling every 15 seconds
-        let pollingInterval;
-        const pollingIndicator = document.getElementById('polling-indicator');
-        const lastUpdateSpan = document.getElementById('last-update');
-        const tournamentStatus = document.getElementById('tournament-status');
-        const gamesContainer = document.getElementById('games-container');
-        const leaderboardBody = document.getElementById('leaderboard-body');
-        
-        function updatePollingIndicator(active) {
-            pollingIndicator.className = active ? 'polling-indicator polling-active' : 'polling-indicator polling-inactive';
-        }
-        
-        function updateLastUpdate() {
-            lastUpdateSpan.textContent = new Date().toLocaleTimeString();
-        }
-        
-        async function fetchTournamentStatus() {
-            updatePollingIndicator(true);
-            try {
-                const response = await fetch('/api/status');
-                const data = await response.json();
-                
-                // Update status
-                tournamentStatus.textContent = data.status.replace('_', ' ');
-                tournamentStatus.className = `status-badge status-${data.status}`;
-                
-                updateLastUpdate();
-            } catch (error) {
-                console.error('Failed to fetch status:', error);
-            } finally {
-                updatePollingIndicator(false);
-            }
-        }
-        
-        async function fetchGames() {
-            try {
-                const response = await fetch('/api/games');
-                const data = await response.json();
-                
-                if (Object.keys(data.games).length === 0) {
-                    gamesContainer.innerHTML = '<div style="text-align: center; color: #666; padding: 2rem;">No games running</div>';
-                    return;
-                }
-                
-                let gamesHtml = '';
-                for (const [gameId, gameData] of Object.entries(data.games)) {
-                    const statusClass = gameData.status || 'unknown';
-                    const players = gameData.players ? gameData.players.join(', ') : 'Unknown players';
-                    const winner = gameData.winner ? `🏆 Winner: ${gameData.winner.name || gameData.winner}` : '';
-                    const duration = gameData.duration ? `⏱️ ${Math.round(gameData.duration)}s` : '';
-                    
-                    // Add visual game link if available
-                    const visualLink = (gameData.status === 'running' || gameData.status === 'completed') ? 
-                        `<div style="margin-top: 0.5rem;">
-                            <a href="http://localhost:3002?gameId=${gameId}" target="_blank" 
-                               style="color: #3498db; text-decoration: none; font-weight: bold; font-size: 0.9rem;"
-                               onclick="checkCatanatronConnection(event, '${gameId}')">
-                               🎮 Watch Visually
-                            </a>
-                        </div>` : '';
-                    
-                    gamesHtml += `
-                        <div class="game-item ${statusClass}">
-                            <div style="font-weight: bold; margin-bottom: 0.5rem;">${gameId}</div>
-                            <div style="margin-bottom: 0.5rem;">Players: ${players}</div>
-                            <div style="margin-bottom: 0.5rem;">Status: ${gameData.status || 'unknown'}</div>
-                            ${winner ? `<div style="margin-bottom: 0.5rem;">${winner}</div>` : ''}
-                            ${duration ? `<div style="color: #666; font-size: 0.9rem;">${duration}</div>` : ''}
-                            ${visualLink}
-                        </div>
-                    `;
-                }
-                
-                gamesContainer.innerHTML = gamesHtml;
-            } catch (error) {
-                console.error('Failed to fetch games:', error);
-            }
-        }
-        
-        async function fetchLeaderboard() {
-            try {
-                const response = await fetch('/api/leaderboard');
-                const data = await response.json();
-                
-                if (data.leaderboard && data.leaderboard.length > 0) {
-                    leaderboardBody.innerHTML = data.leaderboard.map((player, index) => `
-                        <tr>
-                            <td>${index + 1}</td>
-                            <td>${player.player}</td>
-                            <td>${player.wins}</td>
-                            <td>${player.games}</td>
-                            <td>${(player.win_rate * 100).toFixed(1)}%</td>
-                        </tr>
-                    `).join('');
-                }
-            } catch (error) {
-                console.error('Failed to fetch leaderboard:', error);
-            }
-        }
-        
-        async function pollData() {
-            await Promise.all([
-                fetchTournamentStatus(),
-                fetchGames(),
-                fetchLeaderboard()
-            ]);
-        }
-        
-        // Start polling every 15 seconds
-        function startPolling() {
-            pollData(); // Initial load
-            pollingInterval = setInterval(pollData, 15000); // 15 seconds
-        }
-        
-        // Check Catanatron UI connection
-        async function checkCatanatronConnection(event, gameId) {
-            event.preventDefault();
-            
-            try {
-                // Try to fetch from Catanatron UI to check if it's running
-                const response = await fetch('http://localhost:3002', { mode: 'no-cors' });
-                // If we get here, Catanatron UI is running
-                window.open(`http://localhost:3002?gameId=${gameId}`, '_blank');
-            } catch (error) {
-                // Catanatron UI is not running
-                alert(`Visual interface is not currently running.\\n\\nTo start the Catanatron visual interface:\\n\\n` +
-                      `Option 1 (Docker): docker compose up\\n` +
-                      `Option 2 (Manual): Install Node.js 24+ and run:\\n` +
-                      `cd catanatron/ui && npm install && npm run start\\n\\n` +
-                      `Then visit http://localhost:3002 to view Game ${gameId}`);
-            }
-        }
-        
-        // Start when page loads
-        document.addEventListener('DOMContentLoaded', startPolling);
-        
-        // Show polling indicator on first load
-        updatePollingIndicator(false);
-    </script>
-</body>
-</html>
-        '''
\ No newline at end of file
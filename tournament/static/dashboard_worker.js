@@ -0,0 +1,216 @@
+// Dashboard connection worker.
+//
+// One dashboard tab per browser (the leader, elected with a Web Lock) holds the
+// Socket.IO connection and relays every event to the other tabs' workers over a
+// BroadcastChannel. Each worker applies game state patches off the main thread
+// and posts its page only what the page renders.
+
+// Socket.IO client, pinned by its Subresource Integrity hash: the fetch fails
+// unless the downloaded bundle matches, so no unverified CDN code runs here.
+// Only the tab that connects loads it
+const SOCKET_IO_URL = 'https://cdn.socket.io/4.7.4/socket.io.min.js';
+const SOCKET_IO_INTEGRITY = 'sha384-Gr6Lu2Ajx28mzwyVR8CFkULdCU7kMlZ9UthllibdOSo6qAiN+yXNHqtgdTvFXMT4';
+
+async function loadSocketIO() {
+    const response = await fetch(SOCKET_IO_URL, { integrity: SOCKET_IO_INTEGRITY });
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const url = URL.createObjectURL(new Blob([await response.text()], { type: 'text/javascript' }));
+    try {
+        importScripts(url);
+    } finally {
+        URL.revokeObjectURL(url);
+    }
+}
+
+// Server events the dashboard listens to
+const SERVER_EVENTS = [
+    'connect', 'connect_error', 'disconnect', 'tournament_status', 'game_update',
+    'game_state_update', 'games_snapshot', 'leaderboard_snapshot'
+];
+// Snapshot events replayed to tabs that join after the leader received them
+const REPLAYED_EVENTS = ['connect', 'disconnect', 'tournament_status', 'games_snapshot', 'leaderboard_snapshot'];
+
+// Set by the page when it was opened with ?debug
+const DEBUG = new URLSearchParams(self.location.search).has('debug');
+
+// Tabs share one connection only where Web Locks can elect its holder. Without
+// them every tab connects itself and the channel is not used at all: patches
+// relayed from another tab's socket would never match this tab's seq
+const bus = navigator.locks ? new BroadcastChannel('tournament') : null;
+const lastEvents = new Map();
+let socket = null;  // Only set in the leader tab's worker
+
+// Latest known Catanatron state per game, kept current from full states and JSON patches
+const gameStates = {};
+const pendingSyncs = new Set();
+
+// Last card posted per game, and the games whose full states the page asked for
+const lastCards = new Map();
+const forwardedGames = new Set();
+let forwardAllStates = false;
+
+function post(event, data) {
+    self.postMessage({ event, data });
+}
+
+function emit(event, data) {
+    if (socket) {
+        socket.emit(event, data);
+    } else if (bus) {
+        bus.postMessage({ type: 'emit', event, data });
+    }
+}
+
+function applyPatch(target, patch) {
+    for (const { op, path, value } of patch) {
+        const keys = path.split('/').slice(1).map(key => key.replace(/~1/g, '/').replace(/~0/g, '~'));
+        const last = keys.pop();
+        let parent = target;
+        for (const key of keys) {
+            parent = parent[key];
+        }
+        if (op === 'remove') {
+            delete parent[last];
+        } else {
+            parent[last] = value;
+        }
+    }
+}
+
+function receiveGameState(data) {
+    const known = gameStates[data.game_id];
+    if (data.state) {
+        if (known && data.seq <= known.seq) return null;
+        gameStates[data.game_id] = { seq: data.seq, state: data.state };
+        pendingSyncs.delete(data.game_id);
+        return data.state;
+    }
+    if (known && known.seq === data.base_seq) {
+        applyPatch(known.state, data.patch);
+        known.seq = data.seq;
+        return known.state;
+    }
+    // Missed an update: ask the server for the full state once
+    if (!pendingSyncs.has(data.game_id)) {
+        pendingSyncs.add(data.game_id);
+        emit('sync_game_state', { game_id: data.game_id });
+    }
+    return null;
+}
+
+function handle(event, data) {
+    if (event !== 'game_state_update') {
+        post(event, data);
+        return;
+    }
+
+    const state = receiveGameState(data);
+    if (!state) return;
+
+    // The game card only shows these fields; post them when one of them changed
+    const card = {
+        game_id: state.game_id,
+        players: state.players.map(player => player.name),
+        status: state.status,
+        winner: state.winner
+    };
+    const key = JSON.stringify(card);
+    if (lastCards.get(data.game_id) !== key) {
+        lastCards.set(data.game_id, key);
+        post('game_card', { gameId: data.game_id, card });
+    }
+
+    // Full states only go to a page that embeds the Catanatron UI for this game
+    if (forwardAllStates || forwardedGames.has(data.game_id)) {
+        post('game_state', { gameId: data.game_id, state });
+    }
+}
+
+function relay(event, data) {
+    if (bus) {
+        if (REPLAYED_EVENTS.includes(event)) {
+            lastEvents.set(event === 'disconnect' ? 'connect' : event, { event, data });
+        }
+        bus.postMessage({ type: 'event', event, data });
+    }
+    handle(event, data);
+}
+
+async function becomeLeader() {
+    if (DEBUG) console.log('This tab holds the tournament connection');
+    post('leader');
+    try {
+        await loadSocketIO();
+    } catch (error) {
+        relay('connect_error', `Socket.IO client failed to load or verify: ${error.message}`);
+        return;
+    }
+    // Connect only once every handler is registered, so no early event is missed
+    socket = io(self.location.origin, { autoConnect: false });
+    for (const event of SERVER_EVENTS) {
+        socket.on(event, (data, ack) => {
+            // Ack on receipt so the server sends the next coalesced update
+            if (ack) ack();
+            // Errors can't be cloned into a message
+            relay(event, data instanceof Error ? data.message : data);
+        });
+    }
+    if (DEBUG) {
+        socket.onAny((eventName, ...args) => {
+            console.log('Socket.IO event:', eventName, args);
+        });
+    }
+    socket.connect();
+}
+
+function onBusMessage({ data: message }) {
+    if (message.type === 'event') {
+        handle(message.event, message.data);
+    } else if (!socket) {
+        return;
+    } else if (message.type === 'emit') {
+        socket.emit(message.event, message.data);
+    } else if (message.type === 'hello') {
+        // Catch a newly opened tab up on the snapshots and states it missed
+        for (const { event, data } of lastEvents.values()) {
+            bus.postMessage({ type: 'event', event, data });
+        }
+        for (const [gameId, { seq, state }] of Object.entries(gameStates)) {
+            bus.postMessage({ type: 'event', event: 'game_state_update', data: { game_id: gameId, seq, state } });
+        }
+    }
+}
+
+self.onmessage = ({ data: message }) => {
+    if (message.type === 'emit') {
+        emit(message.event, message.data);
+    } else if (message.type === 'forward_states') {
+        if (message.all) {
+            forwardAllStates = true;
+        } else {
+            forwardedGames.add(message.gameId);
+            const known = gameStates[message.gameId];
+            if (known) {
+                post('game_state', { gameId: message.gameId, state: known.state });
+            } else if (!pendingSyncs.has(message.gameId)) {
+                // New clients aren't sent finished games' states; ask for this one
+                pendingSyncs.add(message.gameId);
+                emit('sync_game_state', { game_id: message.gameId });
+            }
+        }
+    }
+};
+
+// Take the connection if no other tab holds it
+if (bus) {
+    bus.onmessage = onBusMessage;
+    // The lock is held until this tab closes, then the next waiting tab takes over
+    navigator.locks.request('tournament-ws', { mode: 'exclusive' }, () => {
+        becomeLeader();
+        return new Promise(() => {});
+    });
+    bus.postMessage({ type: 'hello' });
+} else {
+    // Web Locks need a secure context; without them every tab connects itself
+    becomeLeader();
+}
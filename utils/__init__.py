@@ -1,5 +1,5 @@
 """Utilities for CatanBench."""
 
-from .logging import setup_tournament_logging
+from .logging import setup_tournament_logging, stop_file_logging
 
-__all__ = ["setup_tournament_logging"]
\ No newline at end of file
+__all__ = ["setup_tournament_logging", "stop_file_logging"]
\ No newline at end of file
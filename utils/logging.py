@@ -5,12 +5,33 @@ This module provides logging configuration and utilities for
 tournament management and game analysis.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
 
+# Background thread writing the tournament log file, if one is set up
+_file_listener: Optional[QueueListener] = None
+
+
+def stop_file_logging() -> None:
+    """Stop the background log file writer, writing out any queued records and closing its file."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(stop_file_logging)
+
+
 def setup_tournament_logging(
     log_file: Optional[str] = None,
     level: str = "INFO",
@@ -33,7 +54,8 @@ def setup_tournament_logging(
     logger.handlers.clear()
     
     # Set level
-    logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    logger.setLevel(log_level)
     
     # Create formatter
     if format_string is None:
@@ -53,17 +75,27 @@ def setup_tournament_logging(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Log calls only enqueue the record; a listener thread does the file I/O
+        global _file_listener
+        stop_file_logging()
+        log_queue = queue.Queue(-1)
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
 
+@lru_cache(maxsize=1024)
 def get_game_logger(game_id: str) -> logging.Logger:
     """
     Get a logger for a specific game.
     
+    Cached per game_id, so repeat calls skip the logging module lock.
+    
     Args:
         game_id: Unique game identifier
         
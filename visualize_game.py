@@ -10,59 +10,55 @@ This script provides multiple ways to visualize Catan games:
 
 import argparse
 import json
+import os
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+import orjson
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def create_web_viewer(game_log_path: str):
-    """Create a web-based game viewer using Catanatron's built-in UI."""
-    try:
-        from catanatron.game import Game
-        from catanatron.models.player import RandomPlayer, Color
-        import webbrowser
-        import tempfile
-        import os
-        
-        print("🌐 Starting web-based game viewer...")
-        print("Note: This will open a browser window with an interactive Catan board")
-        
-        # Load the game log
-        with open(game_log_path, 'r') as f:
-            game_data = json.load(f)
-        
-        print(f"📊 Game: {game_data['game_id']}")
-        print(f"🎮 Players: {', '.join([p['name'] for p in game_data['players']])}")
-        print(f"🏆 Winner: {game_data.get('winner', 'Unknown')}")
-        
-        # Create a simple HTML viewer
-        html_content = f"""
+# Longest data: URL create_web_viewer opens directly. Browsers accept far longer
+# ones, but the URL is passed on the browser's command line (32K on Windows)
+_DATA_URL_MAX_LENGTH = 32_000
+
+# Page written by create_web_viewer
+_VIEWER_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html>
 <head>
-    <title>CatanBench Game Viewer - {game_data['game_id']}</title>
+    <title>CatanBench Game Viewer - $game_id</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .game-info {{ background: #f0f0f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .player {{ margin: 10px 0; padding: 10px; border-left: 4px solid #007acc; }}
-        .winner {{ border-left-color: #28a745; background: #f8fff8; }}
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .game-info { background: #f0f0f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+        .player { margin: 10px 0; padding: 10px; border-left: 4px solid #007acc; }
+        .winner { border-left-color: #28a745; background: #f8fff8; }
     </style>
 </head>
 <body>
     <h1>🏰 Catan Game Viewer</h1>
     
     <div class="game-info">
-        <h2>Game: {game_data['game_id']}</h2>
-        <p><strong>Winner:</strong> {game_data.get('winner', 'Unknown')}</p>
+        <h2>Game: $game_id</h2>
+        <p><strong>Winner:</strong> $winner</p>
     </div>
     
     <h3>👥 Players</h3>
-    {''.join([f'<div class="player {'winner' if p['color'] == game_data.get('winner') else ''}"><strong>{p['name']}</strong> ({p['color']})</div>' for p in game_data['players']])}
+    $players_html
     
     <h3>📈 Game Actions</h3>
-    <p>Total actions: {len(game_data.get('actions', []))}</p>
+    <p>Total actions: $action_count</p>
     
     <h3>🎯 Next Steps</h3>
     <p>For full interactive visualization:</p>
@@ -73,19 +69,65 @@ def create_web_viewer(game_log_path: str):
     </ol>
     
     <script>
-        console.log('Game data:', {json.dumps(game_data, indent=2)});
+        console.log('Game data:', $game_json);
     </script>
 </body>
 </html>
-"""
+""")
+
+
+def create_web_viewer(game_log_path: str):
+    """
+    Create a web-based game viewer using Catanatron's built-in UI.
+    
+    Args:
+        game_log_path: Path to the game log JSON file
+    """
+    try:
+        from catanatron.game import Game
+        from catanatron.models.player import RandomPlayer, Color
+        import base64
+        import webbrowser
+        import tempfile
+        
+        print("🌐 Starting web-based game viewer...")
+        print("Note: This will open a browser window with an interactive Catan board")
+        
+        # Load the game log
+        with open(game_log_path, 'r') as f:
+            game_data = json.load(f)
+        
+        print(f"📊 Game: {game_data['game_id']}")
+        print(f"🎮 Players: {', '.join([p['name'] for p in game_data['players']])}")
+        print(f"🏆 Winner: {game_data.get('winner', 'Unknown')}")
         
-        # Save to temp file and open
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
-            temp_path = f.name
+        # Fill in the viewer page; the full game data is embedded for the browser console
+        winner = game_data.get('winner')
+        players_html = ''.join(
+            f'<div class="player {"winner" if p["color"] == winner else ""}"><strong>{p["name"]}</strong> ({p["color"]})</div>'
+            for p in game_data['players']
+        )
+        html_content = _VIEWER_TEMPLATE.safe_substitute(
+            game_id=game_data['game_id'],
+            winner=game_data.get('winner', 'Unknown'),
+            players_html=players_html,
+            action_count=len(game_data.get('actions', [])),
+            game_json=orjson.dumps(game_data, option=orjson.OPT_INDENT_2).decode()
+        )
         
-        webbrowser.open(f'file://{temp_path}')
-        print(f"🌐 Game viewer opened in browser: {temp_path}")
+        # Open the page straight from a data: URL when it is short enough to pass
+        # to the browser; otherwise (or if no browser opened), as for a game with a
+        # long action history, save it to a temp file
+        data_url = 'data:text/html;charset=utf-8;base64,' + base64.b64encode(html_content.encode()).decode()
+        if len(data_url) < _DATA_URL_MAX_LENGTH and webbrowser.open(data_url, new=2):
+            print("🌐 Game viewer opened in browser")
+        else:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
+                f.write(html_content)
+                temp_path = f.name
+            
+            webbrowser.open(f'file://{temp_path}', new=2)
+            print(f"🌐 Game viewer opened in browser: {temp_path}")
         print("💡 Note: For full interactive Catan board, install: pip install catanatron[gui]")
         
     except ImportError as e:
@@ -143,15 +185,55 @@ def show_ascii_board(game_log_path: str):
         print(f"❌ Error showing ASCII board: {e}")
 
 
+def read_game_replay(log_path, limit: int = 20):
+    """
+    Read a game log's id, winner, total action count and first ``limit`` actions.
+    
+    With ijson the log is stream-parsed and the actions after the first ``limit``
+    are never built; they are only counted when the log has no action_count.
+    """
+    with open(log_path, 'rb') as f:
+        if not IJSON_AVAILABLE:
+            game_data = json.load(f)
+            actions = game_data.get('actions', [])
+            return (game_data['game_id'], game_data.get('winner', 'Unknown'),
+                    game_data.get('action_count', len(actions)), actions[:limit])
+        
+        game_id = None
+        winner = 'Unknown'
+        action_count = None
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'game_id':
+                game_id = value
+            elif prefix == 'action_count':
+                action_count = value
+            elif prefix == 'winner':
+                if event == 'start_array':
+                    winner = []
+                elif event != 'end_array':
+                    winner = value
+            elif prefix == 'winner.item':
+                winner.append(value)
+            elif prefix == 'actions':
+                # The actions come last
+                break
+        if game_id is None:
+            raise KeyError('game_id')
+        
+        f.seek(0)
+        items = ijson.items(f, 'actions.item', use_float=True)
+        actions = list(islice(items, limit))
+        if action_count is None:
+            action_count = len(actions) + sum(1 for _ in items)
+        return game_id, winner, action_count, actions
+
+
 def replay_game(game_log_path: str, step_by_step: bool = False):
     """Replay the game actions step by step."""
     try:
-        with open(game_log_path, 'r') as f:
-            game_data = json.load(f)
-        
-        actions = game_data.get('actions', [])
-        print(f"\n🎬 REPLAYING GAME: {game_data['game_id']}")
-        print(f"📊 Total actions: {len(actions)}")
+        game_id, winner, action_count, actions = read_game_replay(game_log_path)
+        print(f"\n🎬 REPLAYING GAME: {game_id}")
+        print(f"📊 Total actions: {action_count}")
         
         if not actions:
             print("❌ No actions found in game log")
@@ -159,29 +241,72 @@ def replay_game(game_log_path: str, step_by_step: bool = False):
         
         print("\n" + "-"*50)
         
-        for i, action in enumerate(actions[:20]):  # Show first 20 actions
+        for i, action in enumerate(actions):  # Show first 20 actions
             if step_by_step:
-                input(f"\nPress Enter for action {i+1}/{len(actions)}...")
+                input(f"\nPress Enter for action {i+1}/{action_count}...")
             
             print(f"Action {i+1:3d}: {action}")
         
-        if len(actions) > 20:
-            print(f"\n... and {len(actions) - 20} more actions")
+        if action_count > len(actions):
+            print(f"\n... and {action_count - len(actions)} more actions")
         
-        print(f"\n🏆 Final result: {game_data.get('winner', 'Unknown')} won!")
+        print(f"\n🏆 Final result: {winner} won!")
         
     except Exception as e:
         print(f"❌ Error replaying game: {e}")
 
 
+def read_game_summary(log_path: Path):
+    """
+    Read just the player names and winner from a game log.
+    
+    With ijson the log is stream-parsed and reading stops once both are found,
+    so the action history after them is never parsed.
+    """
+    with open(log_path, 'rb') as f:
+        if not IJSON_AVAILABLE:
+            game_data = json.load(f)
+            return [p['name'] for p in game_data.get('players', [])], game_data.get('winner', 'Unknown')
+        
+        players = []
+        winner = 'Unknown'
+        players_done = winner_done = False
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'players.item.name':
+                players.append(value)
+            elif prefix == 'players' and event == 'end_array':
+                players_done = True
+            elif prefix == 'winner':
+                if event == 'start_array':
+                    winner = []
+                else:
+                    if event != 'end_array':
+                        winner = value
+                    winner_done = True
+            elif prefix == 'winner.item':
+                winner.append(value)
+            
+            if players_done and winner_done:
+                break
+        return players, winner
+
+
 def list_available_games(results_dir: str = "tournament_results"):
     """List all available game logs."""
     results_path = Path(results_dir)
     
     print(f"📁 Searching for games in: {results_path.absolute()}")
     
-    # Look for game logs
-    game_logs = list(results_path.glob("game_logs/*.json"))
+    # Look for game logs; scandir entries carry their file type, so there is no
+    # per-file stat or glob pattern matching
+    try:
+        with os.scandir(results_path / "game_logs") as entries:
+            game_logs = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        game_logs = []
     
     if not game_logs:
         print("❌ No game logs found.")
@@ -190,17 +315,24 @@ def list_available_games(results_dir: str = "tournament_results"):
     
     print(f"\n🎮 Found {len(game_logs)} game logs:")
     
-    for i, log_path in enumerate(game_logs, 1):
+    def read_summary(log_path):
         try:
-            with open(log_path, 'r') as f:
-                game_data = json.load(f)
-            
-            players = ', '.join([p['name'] for p in game_data.get('players', [])])
-            winner = game_data.get('winner', 'Unknown')
-            print(f"  {i:2d}. {log_path.name} - Players: {players} - Winner: {winner}")
-            
+            return read_game_summary(log_path), None
         except Exception as e:
-            print(f"  {i:2d}. {log_path.name} - Error reading: {e}")
+            return None, e
+    
+    # Read the logs in parallel (file reads release the GIL), printing in order
+    with ThreadPoolExecutor(max_workers=min(32, len(game_logs))) as executor:
+        summaries = list(executor.map(read_summary, game_logs))
+    
+    for i, (log_path, (summary, error)) in enumerate(zip(game_logs, summaries), 1):
+        if error is not None:
+            print(f"  {i:2d}. {log_path.name} - Error reading: {error}")
+            continue
+        
+        player_names, winner = summary
+        players = ', '.join(player_names)
+        print(f"  {i:2d}. {log_path.name} - Players: {players} - Winner: {winner}")
     
     print(f"\n💡 To visualize a game: python visualize_game.py --web {game_logs[0]}")
 